@@ -209,21 +209,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         coordinator: TriadCoordinator = entry.runtime_data
-        # Clean up input link subscriptions
-        # Support both real TriadCoordinator and mocks
-        if isinstance(coordinator, TriadCoordinatorType):
-            for unsub in coordinator.input_link_unsubs:
-                unsub()
-            coordinator.clear_input_link_unsubs()
-        else:
-            # Fallback for mocks - use public API
-            if hasattr(coordinator, "input_link_unsubs"):
-                unsubs = coordinator.input_link_unsubs
-                if isinstance(unsubs, list):
-                    for unsub in unsubs:
-                        unsub()
-            if hasattr(coordinator, "clear_input_link_unsubs"):
-                coordinator.clear_input_link_unsubs()
         try:
             await coordinator.stop()
         except Exception:
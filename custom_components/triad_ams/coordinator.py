@@ -93,13 +93,6 @@ class TriadCoordinator:
         self._availability_listeners: weakref.WeakSet[Callable[[bool], None]] = (
             weakref.WeakSet()
         )
-        # Track input link unsubscribe functions for cleanup
-        self._input_link_unsubs: list[Callable[[], None]] = []
-
-    @property
-    def input_link_unsubs(self) -> list[Callable[[], None]]:
-        """Return the list of input link unsubscribe functions."""
-        return self._input_link_unsubs
 
     @property
     def input_count(self) -> int:
@@ -142,14 +135,6 @@ class TriadCoordinator:
 
         return _unsub
 
-    def add_input_link_unsub(self, unsub: Callable[[], None]) -> None:
-        """Register an input link unsubscribe function for cleanup."""
-        self._input_link_unsubs.append(unsub)
-
-    def clear_input_link_unsubs(self) -> None:
-        """Clear all input link unsubscribe functions."""
-        self._input_link_unsubs.clear()
-
     def set_protocol_debug(self, *, enabled: bool) -> None:
         """Enable or disable protocol-level logging on the connection."""
         self._conn.set_protocol_debug(enabled=enabled)
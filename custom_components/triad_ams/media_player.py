@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.media_player import (
@@ -29,7 +30,6 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
-from .coordinator import TriadCoordinator
 from .models import TriadAmsOutput
 
 _LOGGER = logging.getLogger(__name__)
@@ -65,21 +65,13 @@ def _build_input_names(
     state_getter: Callable[[HomeAssistant, str], State | None] | None = None,
 ) -> dict[int, str]:
     """Build input names dict from linked entities or defaults."""
-    if state_getter is None:
-
-        def state_getter(h: HomeAssistant, eid: str) -> State | None:
-            return h.states.get(eid)
-
-    input_names: dict[int, str] = {}
-    for i in active_inputs:
-        ent_id = input_links_opt.get(str(i))
-        if ent_id:
-            st = state_getter(hass, ent_id)
-            if st:
-                input_names[i] = st.name
-                continue
-        input_names[i] = f"Input {i}"
-    return input_names
+    lookup = hass.states.get if state_getter is None else partial(state_getter, hass)
+    return {
+        i: st.name
+        if (ent_id := input_links_opt.get(str(i))) and (st := lookup(ent_id))
+        else f"Input {i}"
+        for i in active_inputs
+    }
 
 
 @callback
@@ -92,12 +84,11 @@ def _update_input_name_from_state(
     state_getter: Callable[[HomeAssistant, str], State | None] | None = None,
 ) -> None:
     """Update input name from entity state and notify entities."""
-    if state_getter is None:
-
-        def state_getter(h: HomeAssistant, eid: str) -> State | None:
-            return h.states.get(eid)
-
-    new_state = state_getter(hass, entity_id)
+    new_state = (
+        hass.states.get(entity_id)
+        if state_getter is None
+        else state_getter(hass, entity_id)
+    )
     if new_state and new_state.name:
         old_name = config.input_names.get(input_num, f"Input {input_num}")
         new_name = new_state.name
@@ -122,25 +113,19 @@ def _create_input_link_handler(
     state_getter: Callable[[HomeAssistant, str], State | None] | None = None,
 ) -> Any:
     """Create callback handler for input link state changes."""
+    # Map linked entity ids to their active input number once, not per event;
+    # if several inputs link the same entity, the first one wins
+    entity_to_input: dict[str, int] = {}
+    for i in config.active_inputs:
+        if ent_id := config.input_links_opt.get(str(i)):
+            entity_to_input.setdefault(ent_id, i)
 
     @callback
     def _handle_input_link_state_change(event: Any) -> None:
         """Handle state changes from linked input entities."""
         entity_id = event.data.get("entity_id")
-        if not entity_id:
-            return
-
-        # Find which input number this entity is linked to
-        input_num = None
-        for input_str, linked_ent_id in config.input_links_opt.items():
-            if linked_ent_id == entity_id:
-                try:
-                    input_num = int(input_str)
-                    break
-                except ValueError:
-                    continue
-
-        if input_num is None or input_num not in config.active_inputs:
+        input_num = entity_to_input.get(entity_id)
+        if input_num is None:
             return
 
         _update_input_name_from_state(
@@ -156,39 +141,26 @@ def _create_input_link_handler(
 
 def _setup_input_link_subscriptions(
     hass: HomeAssistant,
-    coordinator: Any,
+    entry: ConfigEntry,
     config: InputLinkConfig,
     *,
     state_getter: Callable[[HomeAssistant, str], State | None] | None = None,
 ) -> None:
     """Set up subscriptions to linked entity state changes."""
-    linked_entity_ids = [ent_id for ent_id in config.input_links_opt.values() if ent_id]
+    # Only track entities linked to active inputs; the handler ignores the rest
+    linked_entity_ids = [
+        ent_id
+        for i in config.active_inputs
+        if (ent_id := config.input_links_opt.get(str(i)))
+    ]
     if not linked_entity_ids:
         return
 
     handler = _create_input_link_handler(hass, config, state_getter=state_getter)
     unsub = async_track_state_change_event(hass, linked_entity_ids, handler)
 
-    # Store unsubscribe function to clean up on unload
-    # Check if it's a real TriadCoordinator instance (not a mock)
-    if isinstance(coordinator, TriadCoordinator):
-        coordinator.add_input_link_unsub(unsub)
-    else:
-        # Mock fallback - try to use input_link_unsubs property first
-        # Use getattr to get the actual value, not MagicMock's auto-created attribute
-        unsubs = getattr(coordinator, "input_link_unsubs", None)
-        if isinstance(unsubs, list):
-            unsubs.append(unsub)
-        elif hasattr(coordinator, "add_input_link_unsub"):
-            # Try the public API method if available
-            try:
-                coordinator.add_input_link_unsub(unsub)
-            except (AttributeError, TypeError):
-                # Method doesn't work, fall back to setting the list
-                coordinator.input_link_unsubs = [unsub]
-        else:
-            # No public API available, set it directly
-            coordinator.input_link_unsubs = [unsub]
+    # Unsubscribe when the config entry unloads
+    entry.async_on_unload(unsub)
 
     # Check immediately for any entities that might have become available
     for i in config.active_inputs:
@@ -202,48 +174,36 @@ def _setup_input_link_subscriptions(
             )
 
 
-def _cleanup_stale_entities(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
-    outputs: list[TriadAmsOutput],
-    *,
-    entity_registry_getter: Any = None,
-) -> None:
-    """Remove stale entities for outputs that are no longer active."""
-    if entity_registry_getter is None:
-        entity_registry_getter = er.async_get
-    allowed = {f"{entry.entry_id}_output_{o.number}" for o in outputs}
-    registry = entity_registry_getter(hass)
-    for ent in list(registry.entities.values()):
-        if (
-            ent.platform == DOMAIN
-            and ent.config_entry_id == entry.entry_id
-            and ent.unique_id not in allowed
-        ):
-            registry.async_remove(ent.entity_id)
-
-
-def _remove_orphaned_devices(
+def _cleanup_registries(
     hass: HomeAssistant,
     entry: ConfigEntry,
+    output_numbers: frozenset[int],
     *,
     entity_registry_getter: Any = None,
     device_registry_getter: Any = None,
-    entries_for_device_getter: Any = None,
 ) -> None:
-    """Remove orphaned devices (those without any entities for this entry)."""
+    """Remove stale entities and the devices they leave orphaned."""
     if entity_registry_getter is None:
         entity_registry_getter = er.async_get
     if device_registry_getter is None:
         device_registry_getter = dr.async_get
-    if entries_for_device_getter is None:
-        entries_for_device_getter = er.async_entries_for_device
     registry = entity_registry_getter(hass)
+    # Use the registry's config entry index rather than scanning every entity
+    entries = er.async_entries_for_config_entry(registry, entry.entry_id)
+    prefix = f"{entry.entry_id}_output_"
+    allowed = frozenset(f"{prefix}{n}" for n in output_numbers)
+    stale = [
+        ent.entity_id
+        for ent in entries
+        if ent.platform == DOMAIN and ent.unique_id not in allowed
+    ]
+    for entity_id in stale:
+        registry.async_remove(entity_id)
+
     dev_reg = device_registry_getter(hass)
-    for device in list(dev_reg.devices.values()):
-        if entry.entry_id not in device.config_entries:
-            continue
-        if not entries_for_device_getter(
+    devices = dr.async_entries_for_config_entry(dev_reg, entry.entry_id)
+    for device in devices:
+        if not er.async_entries_for_device(
             registry, device.id, include_disabled_entities=True
         ):
             dev_reg.async_remove_device(device.id)
@@ -274,10 +234,12 @@ async def async_setup_entry(
         i: input_links_opt.get(str(i)) for i in active_inputs
     }
 
+    # Each output keeps a reference to the shared list, so extend it in place
     outputs: list[TriadAmsOutput] = []
-    for ch in sorted(active_outputs):
-        name = f"Output {ch}"
-        outputs.append(TriadAmsOutput(ch, name, coordinator, outputs, input_names))
+    outputs.extend(
+        TriadAmsOutput(ch, f"Output {ch}", coordinator, outputs, input_names)
+        for ch in sorted(active_outputs)
+    )
 
     # Ensure coordinator worker is running before any refresh enqueues commands
     try:
@@ -301,9 +263,8 @@ async def async_setup_entry(
         input_names=input_names,
         entities=entities,
     )
-    _setup_input_link_subscriptions(hass, coordinator, link_config)
-    _cleanup_stale_entities(hass, entry, outputs)
-    _remove_orphaned_devices(hass, entry)
+    _setup_input_link_subscriptions(hass, entry, link_config)
+    _cleanup_registries(hass, entry, frozenset(o.number for o in outputs))
 
 
 class TriadAmsMediaPlayer(MediaPlayerEntity):
@@ -15,6 +15,25 @@ _POST_COMMAND_REFRESH_COOLDOWN_S = 3.0
 class TriadAmsOutput:
     """Represents and manages a single output channel on the Triad AMS."""
 
+    # Outputs are mutable, so slots rather than a frozen dataclass; keep
+    # __weakref__ since the coordinator tracks outputs in a WeakSet.
+    __slots__ = (
+        "__weakref__",
+        "_assigned_input",
+        "_input_count",
+        "_last_assigned_input",
+        "_last_command_time",
+        "_listeners",
+        "_muted",
+        "_outputs",
+        "_ui_on",
+        "_volume",
+        "coordinator",
+        "input_names",
+        "name",
+        "number",
+    )
+
     def __init__(
         self,
         number: int,
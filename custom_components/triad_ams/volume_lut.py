@@ -148,12 +148,12 @@ def step_for_db(db: float) -> int:
         return 1
     if i >= len(_DBS):
         return 100
-    # Choose closer neighbor
+    # Choose closer neighbor; _DBS[i] holds the dB for step i + 1
     before = _DBS[i - 1]
     after = _DBS[i]
     dist_before = abs(db - before)
     dist_after = abs(after - db)
-    return i if dist_after < dist_before else i - 1
+    return i + 1 if dist_after < dist_before else i
 
 
 def percentage_for_step(step: int) -> float:
@@ -21,6 +21,7 @@ from custom_components.triad_ams.coordinator import (
     TriadCoordinator,
     TriadCoordinatorConfig,
 )
+from custom_components.triad_ams.media_player import TriadAmsMediaPlayer
 from custom_components.triad_ams.models import TriadAmsOutput
 
 if TYPE_CHECKING:
@@ -509,6 +510,43 @@ def mock_config_entry() -> MagicMock:
     return entry
 
 
+@pytest.fixture
+def mock_output() -> MagicMock:
+    """Create a mock TriadAmsOutput."""
+    output = MagicMock(spec=TriadAmsOutput)
+    output.number = 1
+    output.name = "Output 1"
+    output.source = None
+    output.source_name = None
+    output.source_list = ["Input 1", "Input 2"]
+    output.is_on = False
+    output.volume = None
+    output.muted = False
+    output.source_id_for_name = MagicMock(return_value=1)
+    output.set_source = create_async_mock_method()
+    output.set_volume = create_async_mock_method()
+    output.set_muted = create_async_mock_method()
+    output.volume_up_step = create_async_mock_method()
+    output.volume_down_step = create_async_mock_method()
+    output.turn_off = create_async_mock_method()
+    output.turn_on = create_async_mock_method()
+    output.refresh_and_notify = create_async_mock_method()
+    output.add_listener = MagicMock(return_value=MagicMock())
+    return output
+
+
+@pytest.fixture
+def media_player(
+    mock_output: MagicMock, mock_config_entry: MagicMock
+) -> TriadAmsMediaPlayer:
+    """Create a TriadAmsMediaPlayer instance."""
+    input_links = {1: None, 2: None}
+    entity = TriadAmsMediaPlayer(mock_output, mock_config_entry, input_links)
+    # Entities are never added to hass here, so stub out state writes
+    entity.async_write_ha_state = MagicMock()
+    return entity
+
+
 @pytest.fixture
 def mock_connection() -> MagicMock:
     """Create a mock TriadConnection."""
@@ -584,14 +622,6 @@ def input_names() -> dict[int, str]:
     return {i: f"Input {i}" for i in range(1, 9)}
 
 
-@pytest.fixture
-def event_loop() -> Generator[asyncio.AbstractEventLoop]:
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(autouse=True)
 def enable_sockets_for_integration_tests(request: pytest.FixtureRequest) -> None:
     """Enable socket usage for integration tests."""
@@ -1,6 +1,6 @@
 """Entity lifecycle and cleanup tests."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from homeassistant.helpers import device_registry as dr
@@ -8,10 +8,7 @@ from homeassistant.helpers import entity_registry as er
 
 import custom_components.triad_ams as triad_ams_module
 from custom_components.triad_ams.coordinator import TriadCoordinator
-from custom_components.triad_ams.media_player import (
-    _cleanup_stale_entities,
-    _remove_orphaned_devices,
-)
+from custom_components.triad_ams.media_player import _cleanup_registries
 from custom_components.triad_ams.models import TriadAmsOutput
 from tests.conftest import create_async_mock_method
 from tests.integration.simulator import TriadAmsSimulator
@@ -117,8 +114,9 @@ class TestEntityCleanup:
         self, mock_hass: MagicMock, mock_config_entry: MagicMock
     ) -> None:
         """Test cleanup of stale entities."""
-        # Create mock entity registry
+        # Create mock registries
         registry = MagicMock(spec=er.EntityRegistry)
+        device_registry = MagicMock(spec=dr.DeviceRegistry)
         # Create mock entities
         entity1 = MagicMock()
         entity1.platform = "triad_ams"
@@ -132,77 +130,68 @@ class TestEntityCleanup:
         entity2.unique_id = "test_entry_123_output_99"  # Stale
         entity2.entity_id = "media_player.test_output_99"
 
-        registry.entities = {
-            "media_player.test_output_1": entity1,
-            "media_player.test_output_99": entity2,
-        }
-
-        # Create outputs (only output 1 is active)
-        outputs = [MagicMock()]
-        outputs[0].number = 1
-
-        # Use registry injection instead of patching
-        _cleanup_stale_entities(
-            mock_hass,
-            mock_config_entry,
-            outputs,
-            entity_registry_getter=lambda _: registry,
-        )
+        # Fake the public lookup helpers; registries come in via injection
+        with (
+            patch.object(
+                er,
+                "async_entries_for_config_entry",
+                return_value=[entity1, entity2],
+            ),
+            patch.object(dr, "async_entries_for_config_entry", return_value=[]),
+        ):
+            _cleanup_registries(
+                mock_hass,
+                mock_config_entry,
+                frozenset({1}),  # Only output 1 is active
+                entity_registry_getter=lambda _: registry,
+                device_registry_getter=lambda _: device_registry,
+            )
 
         # Should remove stale entity
         registry.async_remove.assert_called_once_with("media_player.test_output_99")
 
+    @pytest.mark.parametrize(
+        ("device_entities", "removed"),
+        [([], True), ([MagicMock()], False)],
+        ids=["orphaned", "with_entities"],
+    )
     def test_remove_orphaned_devices(
-        self, mock_hass: MagicMock, mock_config_entry: MagicMock
-    ) -> None:
-        """Test removal of orphaned devices."""
-        # Create mock registries
-        entity_registry = MagicMock(spec=er.EntityRegistry)
-        device_registry = MagicMock(spec=dr.DeviceRegistry)
-        # Create mock device
-        device = MagicMock()
-        device.id = "device_123"
-        device.config_entries = {"test_entry_123"}
-
-        device_registry.devices = {"device_123": device}
-
-        # Use registry injection instead of patching
-        _remove_orphaned_devices(
-            mock_hass,
-            mock_config_entry,
-            entity_registry_getter=lambda _: entity_registry,
-            device_registry_getter=lambda _: device_registry,
-            entries_for_device_getter=lambda _registry, _device_id, **_: [],
-        )
-
-        # Should remove orphaned device
-        device_registry.async_remove_device.assert_called_once_with("device_123")
-
-    def test_remove_orphaned_devices_with_entities(
-        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+        self,
+        mock_hass: MagicMock,
+        mock_config_entry: MagicMock,
+        device_entities: list[MagicMock],
+        removed: bool,  # noqa: FBT001
     ) -> None:
-        """Test that devices with entities are not removed."""
+        """Test that only devices without entities are removed."""
         # Create mock registries
         entity_registry = MagicMock(spec=er.EntityRegistry)
         device_registry = MagicMock(spec=dr.DeviceRegistry)
+        entity = MagicMock()
+        entity.platform = "triad_ams"
+        entity.unique_id = "test_entry_123_output_1"
         # Create mock device
         device = MagicMock()
         device.id = "device_123"
         device.config_entries = {"test_entry_123"}
 
-        device_registry.devices = {"device_123": device}
-
-        # Use registry injection instead of patching
-        _remove_orphaned_devices(
-            mock_hass,
-            mock_config_entry,
-            entity_registry_getter=lambda _: entity_registry,
-            device_registry_getter=lambda _: device_registry,
-            entries_for_device_getter=lambda _registry, _device_id, **_: [MagicMock()],
-        )
-
-        # Should not remove device with entities
-        device_registry.async_remove_device.assert_not_called()
+        # Fake the public lookup helpers; registries come in via injection
+        with (
+            patch.object(er, "async_entries_for_config_entry", return_value=[entity]),
+            patch.object(er, "async_entries_for_device", return_value=device_entities),
+            patch.object(dr, "async_entries_for_config_entry", return_value=[device]),
+        ):
+            _cleanup_registries(
+                mock_hass,
+                mock_config_entry,
+                frozenset({1}),  # Only output 1 is active
+                entity_registry_getter=lambda _: entity_registry,
+                device_registry_getter=lambda _: device_registry,
+            )
+
+        if removed:
+            device_registry.async_remove_device.assert_called_once_with("device_123")
+        else:
+            device_registry.async_remove_device.assert_not_called()
 
 
 class TestOptionsUpdate:
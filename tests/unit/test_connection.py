@@ -352,7 +352,7 @@ class TestTriadConnectionVolume:
 
         volume = await connection.get_output_volume(1)
 
-        assert 0.0 <= volume <= 1.0
+        assert volume == 0.44  # -25.1 dB is measured step 44
 
     @pytest.mark.asyncio
     async def test_get_output_volume_parse_error(
@@ -169,7 +169,6 @@ class TestAsyncUnloadEntry:
         mock_coord = MagicMock()
         mock_coord.stop = create_async_mock_method()
         mock_coord.disconnect = create_async_mock_method()
-        mock_coord.input_link_unsubs = [MagicMock(), MagicMock()]
         config_entry.runtime_data = mock_coord
 
         result = await async_unload_entry(hass, config_entry)
@@ -178,25 +177,6 @@ class TestAsyncUnloadEntry:
         hass.config_entries.async_unload_platforms.assert_called_once()
         mock_coord.stop.assert_called_once()
         mock_coord.disconnect.assert_called_once()
-        # Should clean up input link subscriptions
-        for unsub in mock_coord.input_link_unsubs:
-            unsub.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_async_unload_entry_no_unsubs(
-        self, hass: MagicMock, config_entry: MagicMock
-    ) -> None:
-        """Test unload when no input link subscriptions."""
-        mock_coord = MagicMock()
-        mock_coord.stop = create_async_mock_method()
-        mock_coord.disconnect = create_async_mock_method()
-        # No _input_link_unsubs attribute
-        config_entry.runtime_data = mock_coord
-
-        result = await async_unload_entry(hass, config_entry)
-
-        assert result is True
-        # Should not raise AttributeError
 
     @pytest.mark.asyncio
     async def test_async_unload_entry_handles_stop_error(
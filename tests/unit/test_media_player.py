@@ -1,69 +1,35 @@
 """Unit tests for TriadAmsMediaPlayer."""
 
 import asyncio
-from collections.abc import Coroutine
+from collections.abc import Callable, Coroutine
+from operator import attrgetter
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 from homeassistant.components.media_player import MediaPlayerState
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
 
 from custom_components.triad_ams.media_player import (
     InputEntityNotLinkedError,
     InputNotActiveError,
     TriadAmsMediaPlayer,
 )
-from custom_components.triad_ams.models import TriadAmsOutput
-from tests.conftest import create_async_mock_method
 
-
-@pytest.fixture
-def mock_output() -> MagicMock:
-    """Create a mock TriadAmsOutput."""
-    output = MagicMock(spec=TriadAmsOutput)
-    output.number = 1
-    output.name = "Output 1"
-    output.source = None
-    output.source_name = None
-    output.source_list = ["Input 1", "Input 2"]
-    output.is_on = False
-    output.volume = None
-    output.muted = False
-    output.source_id_for_name = MagicMock(return_value=1)
-    output.set_source = create_async_mock_method()
-    output.set_volume = create_async_mock_method()
-    output.set_muted = create_async_mock_method()
-    output.volume_up_step = create_async_mock_method()
-    output.volume_down_step = create_async_mock_method()
-    output.turn_off = create_async_mock_method()
-    output.turn_on = create_async_mock_method()
-    output.refresh_and_notify = create_async_mock_method()
-    output.add_listener = MagicMock(return_value=MagicMock())
-    return output
-
-
-@pytest.fixture
-def mock_config_entry() -> MagicMock:
-    """Create a mock config entry."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry_123"
-    entry.title = "Test Triad AMS"
-    entry.options = {
-        "active_inputs": [1, 2],
-        "active_outputs": [1],
-        "input_links": {},
-    }
-    return entry
+# Run every async test in this module on one shared event loop; the mark
+# also lands on sync tests, where pytest-asyncio only warns that it is unused
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.filterwarnings(
+        "ignore:The test <Function .*> is marked with '@pytest.mark.asyncio'"
+        ":pytest.PytestWarning"
+    ),
+]
 
 
 @pytest.fixture
-def mock_hass() -> MagicMock:
-    """Create a mock Home Assistant instance."""
-    hass = MagicMock(spec=HomeAssistant)
-    hass.states = MagicMock()
-    hass.states.get = MagicMock(return_value=None)
+def mock_hass() -> SimpleNamespace:
+    """Create a stand-in for the parts of Home Assistant the entity uses."""
 
     def async_create_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
         """Mock async_create_task that schedules the coroutine to run."""
@@ -72,25 +38,52 @@ def mock_hass() -> MagicMock:
         return asyncio.create_task(coro)
 
     # Wrap in MagicMock to track calls
-    mock_create_task = MagicMock(side_effect=async_create_task)
-    hass.async_create_task = mock_create_task
-    return hass
+    return SimpleNamespace(
+        states=SimpleNamespace(get=MagicMock(return_value=None)),
+        async_create_task=MagicMock(side_effect=async_create_task),
+    )
+
+
+@pytest.fixture
+def mock_config_entry() -> SimpleNamespace:
+    """Create a stand-in config entry with the fields the entity reads."""
+    return SimpleNamespace(
+        entry_id="test_entry_123",
+        title="Test Triad AMS",
+        options={"active_inputs": [1, 2], "active_outputs": [1], "input_links": {}},
+    )
+
+
+class _LinkedState:
+    """Minimal stand-in for a linked entity's state."""
+
+    __slots__ = ("attributes",)
+
+    def __init__(self, attributes: dict[str, Any]) -> None:
+        """Store the state attributes."""
+        self.attributes = attributes
 
 
 @pytest.fixture
-def media_player(
-    mock_output: MagicMock, mock_config_entry: MagicMock
-) -> TriadAmsMediaPlayer:
-    """Create a TriadAmsMediaPlayer instance."""
-    input_links = {1: None, 2: None}
-    return TriadAmsMediaPlayer(mock_output, mock_config_entry, input_links)
+def attach_link(
+    media_player: TriadAmsMediaPlayer, mock_hass: SimpleNamespace
+) -> Callable[[dict[str, Any]], None]:
+    """Return a helper linking media_player to a state with given attributes."""
+
+    def _attach(attributes: dict[str, Any]) -> None:
+        state = _LinkedState(attributes)
+        media_player.hass = mock_hass
+        media_player._linked_entity_id = "media_player.test"
+        media_player._state_getter = lambda _hass, _entity_id: state
+
+    return _attach
 
 
 class TestTriadAmsMediaPlayerInitialization:
     """Test TriadAmsMediaPlayer initialization."""
 
     def test_initialization(
-        self, mock_output: MagicMock, mock_config_entry: MagicMock
+        self, mock_output: MagicMock, mock_config_entry: SimpleNamespace
     ) -> None:
         """Test basic initialization."""
         input_links = {1: None, 2: None}
@@ -113,164 +106,137 @@ class TestTriadAmsMediaPlayerInitialization:
 class TestTriadAmsMediaPlayerState:
     """Test state properties."""
 
-    def test_state_off(self, media_player: TriadAmsMediaPlayer) -> None:
-        """Test state when off."""
-        media_player.output.is_on = False
-        assert media_player.state == MediaPlayerState.OFF
-
-    def test_state_on(self, media_player: TriadAmsMediaPlayer) -> None:
-        """Test state when on."""
-        media_player.output.is_on = True
-        assert media_player.state == MediaPlayerState.ON
-
-    def test_is_on(self, media_player: TriadAmsMediaPlayer) -> None:
-        """Test is_on property."""
-        media_player.output.is_on = True
-        assert media_player.is_on is True
-
-    def test_source(self, media_player: TriadAmsMediaPlayer) -> None:
-        """Test source property."""
-        media_player.output.source_name = "Input 1"
-        assert media_player.source == "Input 1"
-
-    def test_source_none(self, media_player: TriadAmsMediaPlayer) -> None:
-        """Test source when None."""
-        media_player.output.source_name = None
-        assert media_player.source is None
-
-    def test_source_list(self, media_player: TriadAmsMediaPlayer) -> None:
-        """Test source_list property."""
-        media_player.output.source_list = ["Input 1", "Input 2"]
-        assert media_player.source_list == ["Input 1", "Input 2"]
-
-    def test_volume_level(self, media_player: TriadAmsMediaPlayer) -> None:
-        """Test volume_level property."""
-        media_player.output.volume = 0.75
-        assert media_player.volume_level == 0.75
-
-    def test_volume_level_none(self, media_player: TriadAmsMediaPlayer) -> None:
-        """Test volume_level when None."""
-        media_player.output.volume = None
-        assert media_player.volume_level is None
-
-    def test_is_volume_muted(self, media_player: TriadAmsMediaPlayer) -> None:
-        """Test is_volume_muted property."""
-        media_player.output.muted = True
-        assert media_player.is_volume_muted is True
+    @pytest.mark.parametrize(
+        ("output_attr", "output_value", "read", "expected"),
+        [
+            ("is_on", False, attrgetter("state"), MediaPlayerState.OFF),
+            ("is_on", True, attrgetter("state"), MediaPlayerState.ON),
+            ("is_on", True, attrgetter("is_on"), True),
+            ("source_name", "Input 1", attrgetter("source"), "Input 1"),
+            ("source_name", None, attrgetter("source"), None),
+            (
+                "source_list",
+                ["Input 1", "Input 2"],
+                attrgetter("source_list"),
+                ["Input 1", "Input 2"],
+            ),
+            ("volume", 0.75, attrgetter("volume_level"), 0.75),
+            ("volume", None, attrgetter("volume_level"), None),
+            ("muted", True, attrgetter("is_volume_muted"), True),
+        ],
+        ids=[
+            "state_off",
+            "state_on",
+            "is_on",
+            "source",
+            "source_none",
+            "source_list",
+            "volume_level",
+            "volume_level_none",
+            "is_volume_muted",
+        ],
+    )
+    def test_property_reflects_output(
+        self,
+        media_player: TriadAmsMediaPlayer,
+        output_attr: str,
+        output_value: Any,
+        read: Callable[[TriadAmsMediaPlayer], Any],
+        expected: Any,
+    ) -> None:
+        """Test entity properties mirror the underlying output."""
+        setattr(media_player.output, output_attr, output_value)
+        assert read(media_player) == expected
 
 
 class TestTriadAmsMediaPlayerMediaAttributes:
     """Test media attributes from linked entities."""
 
     def test_media_title_no_link(
-        self, media_player: TriadAmsMediaPlayer, mock_hass: MagicMock
+        self, media_player: TriadAmsMediaPlayer, mock_hass: SimpleNamespace
     ) -> None:
         """Test media_title when no linked entity."""
         media_player.hass = mock_hass
         media_player.output.source = None
         assert media_player.media_title is None
 
-    def test_media_title_with_link(
-        self, media_player: TriadAmsMediaPlayer, mock_hass: MagicMock
-    ) -> None:
-        """Test media_title from linked entity."""
-        # Simple state object - no MagicMock
-        state = type("State", (), {"attributes": {"media_title": "Test Song"}})()
-
-        def state_getter(_hass: HomeAssistant, _entity_id: str) -> Any:
-            return state
-
-        media_player.hass = mock_hass
-        media_player._input_links = {1: "media_player.test"}
-        media_player.output.source = 1
-        media_player._state_getter = state_getter
-
-        # Need to set up the link subscription
-        media_player._linked_entity_id = "media_player.test"
-        assert media_player.media_title == "Test Song"
-
-    def test_media_artist(
-        self, media_player: TriadAmsMediaPlayer, mock_hass: MagicMock
-    ) -> None:
-        """Test media_artist from linked entity."""
-        # Simple state object - no MagicMock
-        state = type("State", (), {"attributes": {"media_artist": "Test Artist"}})()
-
-        def state_getter(_hass: HomeAssistant, _entity_id: str) -> Any:
-            return state
-
-        media_player.hass = mock_hass
-        media_player._linked_entity_id = "media_player.test"
-        media_player._state_getter = state_getter
-        assert media_player.media_artist == "Test Artist"
-
-    def test_media_album_name(
-        self, media_player: TriadAmsMediaPlayer, mock_hass: MagicMock
-    ) -> None:
-        """Test media_album_name from linked entity."""
-        # Simple state object - no MagicMock
-        state = type("State", (), {"attributes": {"media_album_name": "Test Album"}})()
-
-        def state_getter(_hass: HomeAssistant, _entity_id: str) -> Any:
-            return state
-
-        media_player.hass = mock_hass
-        media_player._linked_entity_id = "media_player.test"
-        media_player._state_getter = state_getter
-        assert media_player.media_album_name == "Test Album"
-
-    def test_media_duration(
-        self, media_player: TriadAmsMediaPlayer, mock_hass: MagicMock
-    ) -> None:
-        """Test media_duration from linked entity."""
-        # Simple state object - no MagicMock
-        state = type("State", (), {"attributes": {"media_duration": 180}})()
-
-        def state_getter(_hass: HomeAssistant, _entity_id: str) -> Any:
-            return state
-
-        media_player.hass = mock_hass
-        media_player._linked_entity_id = "media_player.test"
-        media_player._state_getter = state_getter
-        assert media_player.media_duration == 180
-
-    def test_entity_picture(
-        self, media_player: TriadAmsMediaPlayer, mock_hass: MagicMock
+    @pytest.mark.parametrize(
+        ("prop", "value"),
+        [
+            ("media_title", "Test Song"),
+            ("media_artist", "Test Artist"),
+            ("media_album_name", "Test Album"),
+            ("media_duration", 180),
+            ("entity_picture", "http://example.com/art.jpg"),
+            ("media_content_id", "track_123"),
+            ("media_content_type", "music"),
+        ],
+    )
+    def test_linked_media_attribute(
+        self,
+        media_player: TriadAmsMediaPlayer,
+        attach_link: Callable[[dict[str, Any]], None],
+        prop: str,
+        value: Any,
     ) -> None:
-        """Test entity_picture from linked entity."""
-        # Simple state object - no MagicMock
-        state = type(
-            "State",
-            (),
-            {"attributes": {"entity_picture": "http://example.com/art.jpg"}},
-        )()
-
-        def state_getter(_hass: HomeAssistant, _entity_id: str) -> Any:
-            return state
-
-        media_player.hass = mock_hass
-        media_player._linked_entity_id = "media_player.test"
-        media_player._state_getter = state_getter
-        assert media_player.entity_picture == "http://example.com/art.jpg"
+        """Test media attributes are read from the linked entity."""
+        attach_link({prop: value})
+        assert getattr(media_player, prop) == value
 
 
 class TestTriadAmsMediaPlayerServices:
     """Test service methods."""
 
-    @pytest.mark.asyncio
-    async def test_async_select_source(
-        self, media_player: TriadAmsMediaPlayer, mock_output: MagicMock
+    @pytest.mark.parametrize(
+        ("method", "args", "kwargs", "output_method", "expected", "refreshes"),
+        [
+            ("async_select_source", ("Input 2",), {}, "set_source", call(2), False),
+            ("async_set_volume_level", (0.75,), {}, "set_volume", call(0.75), False),
+            (
+                "async_mute_volume",
+                (),
+                {"mute": True},
+                "set_muted",
+                call(muted=True),
+                False,
+            ),
+            ("async_volume_up", (), {}, "volume_up_step", call(large=False), True),
+            ("async_volume_down", (), {}, "volume_down_step", call(large=False), True),
+            ("async_turn_off", (), {}, "turn_off", call(), False),
+            ("async_turn_on", (), {}, "turn_on", call(), False),
+        ],
+        ids=[
+            "select_source",
+            "set_volume_level",
+            "mute_volume",
+            "volume_up",
+            "volume_down",
+            "turn_off",
+            "turn_on",
+        ],
+    )
+    async def test_service_forwards_to_output(  # noqa: PLR0913
+        self,
+        media_player: TriadAmsMediaPlayer,
+        mock_output: MagicMock,
+        method: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        output_method: str,
+        expected: Any,
+        refreshes: bool,  # noqa: FBT001
     ) -> None:
-        """Test selecting a source."""
+        """Test services call the matching output method and write state."""
         mock_output.source_id_for_name.return_value = 2
-        media_player.async_write_ha_state = MagicMock()
 
-        await media_player.async_select_source("Input 2")
+        await getattr(media_player, method)(*args, **kwargs)
 
-        mock_output.set_source.assert_called_once_with(2)
+        getattr(mock_output, output_method).assert_called_once_with(
+            *expected.args, **expected.kwargs
+        )
+        assert mock_output.refresh.call_count == int(refreshes)
         media_player.async_write_ha_state.assert_called()
 
-    @pytest.mark.asyncio
     async def test_async_select_source_unknown(
         self, media_player: TriadAmsMediaPlayer, mock_output: MagicMock
     ) -> None:
@@ -281,134 +247,49 @@ class TestTriadAmsMediaPlayerServices:
         # Should not call set_source
         mock_output.set_source.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_async_set_volume_level(
-        self, media_player: TriadAmsMediaPlayer, mock_output: MagicMock
-    ) -> None:
-        """Test setting volume level."""
-        media_player.async_write_ha_state = MagicMock()
-
-        await media_player.async_set_volume_level(0.75)
-
-        mock_output.set_volume.assert_called_once_with(0.75)
-        media_player.async_write_ha_state.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_async_mute_volume(
-        self, media_player: TriadAmsMediaPlayer, mock_output: MagicMock
-    ) -> None:
-        """Test muting volume."""
-        media_player.async_write_ha_state = MagicMock()
-
-        await media_player.async_mute_volume(mute=True)
-
-        mock_output.set_muted.assert_called_once_with(muted=True)
-        media_player.async_write_ha_state.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_async_volume_up(
-        self, media_player: TriadAmsMediaPlayer, mock_output: MagicMock
-    ) -> None:
-        """Test volume up."""
-        media_player.async_write_ha_state = MagicMock()
-
-        await media_player.async_volume_up()
-
-        mock_output.volume_up_step.assert_called_once_with(large=False)
-        mock_output.refresh.assert_called_once()
-        media_player.async_write_ha_state.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_async_volume_down(
-        self, media_player: TriadAmsMediaPlayer, mock_output: MagicMock
-    ) -> None:
-        """Test volume down."""
-        media_player.async_write_ha_state = MagicMock()
-
-        await media_player.async_volume_down()
-
-        mock_output.volume_down_step.assert_called_once_with(large=False)
-        mock_output.refresh.assert_called_once()
-        media_player.async_write_ha_state.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_async_turn_off(
-        self, media_player: TriadAmsMediaPlayer, mock_output: MagicMock
-    ) -> None:
-        """Test turning off."""
-        media_player.async_write_ha_state = MagicMock()
-
-        await media_player.async_turn_off()
-
-        mock_output.turn_off.assert_called_once()
-        media_player.async_write_ha_state.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_async_turn_on(
-        self, media_player: TriadAmsMediaPlayer, mock_output: MagicMock
-    ) -> None:
-        """Test turning on."""
-        media_player.async_write_ha_state = MagicMock()
-
-        await media_player.async_turn_on()
-
-        mock_output.turn_on.assert_called_once()
-        media_player.async_write_ha_state.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_async_turn_on_with_source_valid(
-        self, media_player: TriadAmsMediaPlayer, mock_output: MagicMock
-    ) -> None:
-        """Test turn_on_with_source with valid input."""
-        media_player._input_links = {1: "media_player.input1"}
-        media_player._options = {"active_inputs": [1]}
-        media_player.async_write_ha_state = MagicMock()
-
-        await media_player.async_turn_on_with_source("media_player.input1")
-
-        mock_output.set_source.assert_called_once_with(1)
-        mock_output.turn_on.assert_called_once()
-        media_player.async_write_ha_state.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_async_turn_on_with_source_invalid_link(
+    @pytest.mark.parametrize(
+        ("target", "active_inputs", "error"),
+        [
+            ("media_player.input1", [1], None),
+            ("media_player.unknown", [1], InputEntityNotLinkedError),
+            ("media_player.input1", [2], InputNotActiveError),
+        ],
+        ids=["valid", "invalid_link", "inactive"],
+    )
+    async def test_async_turn_on_with_source(
         self,
         media_player: TriadAmsMediaPlayer,
         mock_output: MagicMock,
+        target: str,
+        active_inputs: list[int],
+        error: type[Exception] | None,
     ) -> None:
-        """Test turn_on_with_source with invalid input link."""
+        """Test turn_on_with_source routes linked, active inputs only."""
         media_player._input_links = {1: "media_player.input1"}
+        media_player._options = {"active_inputs": active_inputs}
 
-        with pytest.raises(InputEntityNotLinkedError):
-            await media_player.async_turn_on_with_source("media_player.unknown")
-
-    @pytest.mark.asyncio
-    async def test_async_turn_on_with_source_inactive(
-        self,
-        media_player: TriadAmsMediaPlayer,
-        mock_output: MagicMock,
-    ) -> None:
-        """Test turn_on_with_source with inactive input."""
-        media_player._input_links = {1: "media_player.input1"}
-        media_player._options = {"active_inputs": [2]}  # Input 1 not active
-
-        with pytest.raises(InputNotActiveError):
-            await media_player.async_turn_on_with_source("media_player.input1")
+        if error is None:
+            await media_player.async_turn_on_with_source(target)
+            mock_output.set_source.assert_called_once_with(1)
+            mock_output.turn_on.assert_called_once()
+            media_player.async_write_ha_state.assert_called()
+        else:
+            with pytest.raises(error):
+                await media_player.async_turn_on_with_source(target)
+            mock_output.set_source.assert_not_called()
 
 
 class TestTriadAmsMediaPlayerLifecycle:
     """Test entity lifecycle."""
 
-    @pytest.mark.asyncio
     async def test_async_added_to_hass(
         self,
         media_player: TriadAmsMediaPlayer,
-        mock_hass: MagicMock,
+        mock_hass: SimpleNamespace,
         mock_output: MagicMock,
     ) -> None:
         """Test entity added to hass."""
         media_player.hass = mock_hass
-        media_player.async_write_ha_state = MagicMock()
         # Add mock coordinator for availability listener (Silver requirement)
         mock_coordinator = MagicMock()
         mock_coordinator.is_available = True
@@ -421,7 +302,6 @@ class TestTriadAmsMediaPlayerLifecycle:
         mock_hass.async_create_task.assert_called_once()
         media_player.async_write_ha_state.assert_called()
 
-    @pytest.mark.asyncio
     async def test_async_will_remove_from_hass(
         self,
         media_player: TriadAmsMediaPlayer,
@@ -440,9 +320,8 @@ class TestTriadAmsMediaPlayerLifecycle:
 class TestTriadAmsMediaPlayerLinkSubscription:
     """Test input link subscriptions."""
 
-    @pytest.mark.asyncio
-    async def test_link_subscription_update(
-        self, media_player: TriadAmsMediaPlayer, mock_hass: MagicMock
+    def test_link_subscription_update(
+        self, media_player: TriadAmsMediaPlayer, mock_hass: SimpleNamespace
     ) -> None:
         """Test updating link subscription."""
         # Return a regular callable, not an AsyncMock
@@ -460,11 +339,10 @@ class TestTriadAmsMediaPlayerLinkSubscription:
             # Should subscribe to linked entity
             assert media_player._linked_entity_id == "media_player.input1"
 
-    @pytest.mark.asyncio
-    async def test_link_subscription_removal(
+    def test_link_subscription_removal(
         self,
         media_player: TriadAmsMediaPlayer,
-        mock_hass: MagicMock,
+        mock_hass: SimpleNamespace,
     ) -> None:
         """Test removing link subscription."""
         # Patch async_track_state_change_event - it's a regular function that
@@ -495,23 +373,16 @@ class TestTriadAmsMediaPlayerLinkSubscription:
             assert unsub_called
             assert media_player._linked_entity_id is None
 
-    @pytest.mark.asyncio
-    async def test_handle_linked_state_change(
+    def test_handle_linked_state_change(
         self, media_player: TriadAmsMediaPlayer
     ) -> None:
         """Test handling linked entity state change."""
-        media_player.async_write_ha_state = MagicMock()
-
         media_player._handle_linked_state_change(MagicMock())
 
         media_player.async_write_ha_state.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_handle_output_poll_update(
-        self, media_player: TriadAmsMediaPlayer
-    ) -> None:
+    def test_handle_output_poll_update(self, media_player: TriadAmsMediaPlayer) -> None:
         """Test handling output poll update."""
-        media_player.async_write_ha_state = MagicMock()
         media_player._update_link_subscription = MagicMock()
 
         media_player._handle_output_poll_update()
@@ -519,88 +390,41 @@ class TestTriadAmsMediaPlayerLinkSubscription:
         media_player._update_link_subscription.assert_called_once()
         media_player.async_write_ha_state.assert_called_once()
 
-    def test_current_linked_entity_id_with_source(
-        self, media_player: TriadAmsMediaPlayer
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [(1, "media_player.input1"), (None, None)],
+        ids=["with_source", "no_source"],
+    )
+    def test_current_linked_entity_id(
+        self, media_player: TriadAmsMediaPlayer, source: int | None, expected: Any
     ) -> None:
-        """Test _current_linked_entity_id when source is set."""
+        """Test _current_linked_entity_id follows the routed source."""
         media_player._input_links = {1: "media_player.input1"}
-        media_player.output.source = 1
-
-        result = media_player._current_linked_entity_id()
-
-        assert result == "media_player.input1"
-
-    def test_current_linked_entity_id_no_source(
-        self, media_player: TriadAmsMediaPlayer
-    ) -> None:
-        """Test _current_linked_entity_id when source is None."""
-        media_player.output.source = None
-
-        result = media_player._current_linked_entity_id()
-
-        assert result is None
-
-    def test_linked_attr_no_linked_entity(
-        self, media_player: TriadAmsMediaPlayer
-    ) -> None:
-        """Test _linked_attr when no linked entity."""
-        media_player._linked_entity_id = None
-
-        result = media_player._linked_attr("media_title")
-
-        assert result is None
-
-    def test_linked_attr_no_hass(self, media_player: TriadAmsMediaPlayer) -> None:
-        """Test _linked_attr when hass is None."""
-        media_player._linked_entity_id = "media_player.test"
-        media_player.hass = None
-
-        result = media_player._linked_attr("media_title")
-
-        assert result is None
-
-    def test_linked_attr_state_not_found(
-        self, media_player: TriadAmsMediaPlayer, mock_hass: MagicMock
-    ) -> None:
-        """Test _linked_attr when state is not found."""
-
-        def state_getter(_hass: HomeAssistant, _entity_id: str) -> None:
-            return None
-
-        media_player.hass = mock_hass
-        media_player._linked_entity_id = "media_player.test"
-        media_player._state_getter = state_getter
-
-        result = media_player._linked_attr("media_title")
-
-        assert result is None
-
-    def test_media_content_id(
-        self, media_player: TriadAmsMediaPlayer, mock_hass: MagicMock
-    ) -> None:
-        """Test media_content_id from linked entity."""
-        # Simple state object - no MagicMock
-        state = type("State", (), {"attributes": {"media_content_id": "track_123"}})()
-
-        def state_getter(_hass: HomeAssistant, _entity_id: str) -> Any:
-            return state
-
-        media_player.hass = mock_hass
-        media_player._linked_entity_id = "media_player.test"
-        media_player._state_getter = state_getter
-        assert media_player.media_content_id == "track_123"
-
-    def test_media_content_type(
-        self, media_player: TriadAmsMediaPlayer, mock_hass: MagicMock
+        media_player.output.source = source
+
+        assert media_player._current_linked_entity_id() == expected
+
+    @pytest.mark.parametrize(
+        ("linked_entity_id", "has_hass", "state"),
+        [
+            # A state is available, so only the guard can yield None
+            (None, True, _LinkedState({"media_title": "x"})),
+            ("media_player.test", False, _LinkedState({"media_title": "x"})),
+            ("media_player.test", True, None),
+        ],
+        ids=["no_linked_entity", "no_hass", "state_not_found"],
+    )
+    def test_linked_attr_returns_none(
+        self,
+        media_player: TriadAmsMediaPlayer,
+        mock_hass: SimpleNamespace,
+        linked_entity_id: str | None,
+        has_hass: bool,  # noqa: FBT001
+        state: _LinkedState | None,
     ) -> None:
-        """Test media_content_type from linked entity."""
-        # Simple state object - no MagicMock
-        state = type("State", (), {"attributes": {"media_content_type": "music"}})()
-
-        def state_getter(_hass: HomeAssistant, _entity_id: str) -> Any:
-            return state
+        """Test _linked_attr is None without a link, hass or linked state."""
+        media_player.hass = mock_hass if has_hass else None
+        media_player._linked_entity_id = linked_entity_id
+        media_player._state_getter = lambda _hass, _entity_id: state
 
-        media_player.hass = mock_hass
-        media_player._linked_entity_id = "media_player.test"
-        media_player._state_getter = state_getter
-        assert media_player.media_content_type == "music"
+        assert media_player._linked_attr("media_title") is None
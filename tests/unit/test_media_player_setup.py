@@ -2,11 +2,11 @@
 
 import asyncio
 from collections.abc import Coroutine
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
@@ -15,9 +15,8 @@ from custom_components.triad_ams.media_player import (
     InputLinkConfig,
     TriadAmsMediaPlayer,
     _build_input_names,
-    _cleanup_stale_entities,
+    _cleanup_registries,
     _create_input_link_handler,
-    _remove_orphaned_devices,
     _setup_input_link_subscriptions,
     _update_input_name_from_state,
     async_setup_entry,
@@ -25,13 +24,12 @@ from custom_components.triad_ams.media_player import (
 from custom_components.triad_ams.models import TriadAmsOutput
 from tests.conftest import create_async_mock_method
 
+_MEDIA_PLAYER = "custom_components.triad_ams.media_player"
+
 
 @pytest.fixture
-def mock_hass() -> MagicMock:
-    """Create a mock Home Assistant instance."""
-    hass = MagicMock(spec=HomeAssistant)
-    hass.states = MagicMock()
-    hass.states.get = MagicMock(return_value=None)
+def mock_hass() -> SimpleNamespace:
+    """Create a stand-in for the parts of Home Assistant setup uses."""
 
     def async_create_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
         """Mock async_create_task that schedules the coroutine to run."""
@@ -40,25 +38,27 @@ def mock_hass() -> MagicMock:
         return asyncio.create_task(coro)
 
     # Wrap in MagicMock to track calls
-    mock_create_task = MagicMock(side_effect=async_create_task)
-    hass.async_create_task = mock_create_task
-    return hass
+    return SimpleNamespace(
+        states=SimpleNamespace(get=MagicMock(return_value=None)),
+        async_create_task=MagicMock(side_effect=async_create_task),
+    )
 
 
 @pytest.fixture
-def mock_config_entry() -> MagicMock:
-    """Create a mock config entry."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry_123"
-    entry.title = "Test Triad AMS"
-    entry.data = {"host": "192.168.1.100", "port": 52000}
-    entry.options = {
-        "active_inputs": [1, 2, 3],
-        "active_outputs": [1, 2],
-        "input_links": {},
-    }
-    entry.runtime_data = None
-    return entry
+def mock_config_entry() -> SimpleNamespace:
+    """Create a stand-in config entry with the fields setup reads."""
+    return SimpleNamespace(
+        entry_id="test_entry_123",
+        title="Test Triad AMS",
+        data={"host": "192.168.1.100", "port": 52000},
+        options={
+            "active_inputs": [1, 2, 3],
+            "active_outputs": [1, 2],
+            "input_links": {},
+        },
+        runtime_data=None,
+        async_on_unload=MagicMock(),
+    )
 
 
 @pytest.fixture
@@ -79,7 +79,7 @@ def mock_async_add_entities() -> MagicMock:
 class TestBuildInputNames:
     """Test _build_input_names function."""
 
-    def test_build_input_names_default(self, mock_hass: MagicMock) -> None:
+    def test_build_input_names_default(self, mock_hass: SimpleNamespace) -> None:
         """Test building input names with defaults."""
         active_inputs = [1, 2, 3]
         input_links_opt = {}
@@ -88,7 +88,9 @@ class TestBuildInputNames:
 
         assert result == {1: "Input 1", 2: "Input 2", 3: "Input 3"}
 
-    def test_build_input_names_with_linked_entity(self, mock_hass: MagicMock) -> None:
+    def test_build_input_names_with_linked_entity(
+        self, mock_hass: SimpleNamespace
+    ) -> None:
         """Test building input names with linked entity."""
         active_inputs = [1, 2]
         input_links_opt = {"1": "media_player.input1"}
@@ -107,7 +109,7 @@ class TestBuildInputNames:
         assert result[2] == "Input 2"
 
     def test_build_input_names_linked_entity_not_found(
-        self, mock_hass: MagicMock
+        self, mock_hass: SimpleNamespace
     ) -> None:
         """Test building input names when linked entity doesn't exist."""
         active_inputs = [1, 2]
@@ -127,7 +129,7 @@ class TestBuildInputNames:
 class TestUpdateInputNameFromState:
     """Test _update_input_name_from_state function."""
 
-    def test_update_input_name_changes_name(self, mock_hass: MagicMock) -> None:
+    def test_update_input_name_changes_name(self, mock_hass: SimpleNamespace) -> None:
         """Test updating input name when state changes."""
         input_names = {1: "Input 1", 2: "Input 2"}
         entities = [MagicMock(), MagicMock()]
@@ -158,7 +160,7 @@ class TestUpdateInputNameFromState:
         for entity in entities:
             entity.async_write_ha_state.assert_called_once()
 
-    def test_update_input_name_no_change(self, mock_hass: MagicMock) -> None:
+    def test_update_input_name_no_change(self, mock_hass: SimpleNamespace) -> None:
         """Test updating input name when name doesn't change."""
         input_names = {1: "Input 1"}
         entities = [MagicMock()]
@@ -187,7 +189,7 @@ class TestUpdateInputNameFromState:
         # Should not call async_write_ha_state
         entities[0].async_write_ha_state.assert_not_called()
 
-    def test_update_input_name_no_state(self, mock_hass: MagicMock) -> None:
+    def test_update_input_name_no_state(self, mock_hass: SimpleNamespace) -> None:
         """Test updating input name when state is None."""
         input_names = {1: "Input 1"}
         entities = [MagicMock()]
@@ -218,7 +220,9 @@ class TestUpdateInputNameFromState:
 class TestCreateInputLinkHandler:
     """Test _create_input_link_handler function."""
 
-    def test_handle_input_link_state_change_valid(self, mock_hass: MagicMock) -> None:
+    def test_handle_input_link_state_change_valid(
+        self, mock_hass: SimpleNamespace
+    ) -> None:
         """Test handling valid input link state change."""
         input_links_opt = {"1": "media_player.input1", "2": "media_player.input2"}
         active_inputs = [1, 2]
@@ -251,7 +255,7 @@ class TestCreateInputLinkHandler:
         entities[0].async_write_ha_state.assert_called_once()
 
     def test_handle_input_link_state_change_no_entity_id(
-        self, mock_hass: MagicMock
+        self, mock_hass: SimpleNamespace
     ) -> None:
         """Test handling state change with no entity_id."""
         input_links_opt = {"1": "media_player.input1"}
@@ -276,7 +280,7 @@ class TestCreateInputLinkHandler:
         assert input_names[1] == "Input 1"
 
     def test_handle_input_link_state_change_unknown_entity(
-        self, mock_hass: MagicMock
+        self, mock_hass: SimpleNamespace
     ) -> None:
         """Test handling state change for unknown entity."""
         input_links_opt = {"1": "media_player.input1"}
@@ -301,7 +305,7 @@ class TestCreateInputLinkHandler:
         assert input_names[1] == "Input 1"
 
     def test_handle_input_link_state_change_inactive_input(
-        self, mock_hass: MagicMock
+        self, mock_hass: SimpleNamespace
     ) -> None:
         """Test handling state change for inactive input."""
         input_links_opt = {"1": "media_player.input1"}
@@ -325,13 +329,55 @@ class TestCreateInputLinkHandler:
         # Should not update anything
         assert 1 not in input_names
 
+    def test_handler_does_not_rebuild_all_names(
+        self, monkeypatch: pytest.MonkeyPatch, mock_hass: SimpleNamespace
+    ) -> None:
+        """Test that link events update one name in place without a rebuild."""
+        input_names = {1: "Input 1", 2: "Input 2"}
+        config = InputLinkConfig(
+            input_links_opt={"1": "media_player.input1"},
+            active_inputs=[1, 2],
+            input_names=input_names,
+            entities=[MagicMock()],
+        )
+        state = type("State", (), {"name": "Updated Name"})()
+        mock_build = MagicMock()
+        monkeypatch.setattr(f"{_MEDIA_PLAYER}._build_input_names", mock_build)
+        handler = _create_input_link_handler(
+            mock_hass, config, state_getter=lambda _hass, _entity_id: state
+        )
+
+        handler(SimpleNamespace(data={"entity_id": "media_player.input1"}))
+
+        mock_build.assert_not_called()
+        assert input_names == {1: "Updated Name", 2: "Input 2"}
+
+    def test_handler_duplicate_link_updates_first_input(
+        self, mock_hass: SimpleNamespace
+    ) -> None:
+        """Test that an entity linked to several inputs updates the first one."""
+        input_names = {1: "Input 1", 2: "Input 2"}
+        config = InputLinkConfig(
+            input_links_opt={"1": "media_player.shared", "2": "media_player.shared"},
+            active_inputs=[1, 2],
+            input_names=input_names,
+            entities=[MagicMock()],
+        )
+        state = type("State", (), {"name": "Updated Name"})()
+        handler = _create_input_link_handler(
+            mock_hass, config, state_getter=lambda _hass, _entity_id: state
+        )
+
+        handler(SimpleNamespace(data={"entity_id": "media_player.shared"}))
+
+        assert input_names == {1: "Updated Name", 2: "Input 2"}
+
 
 class TestSetupInputLinkSubscriptions:
     """Test _setup_input_link_subscriptions function."""
 
-    @pytest.mark.asyncio
-    async def test_setup_input_link_subscriptions_no_links(
-        self, mock_hass: MagicMock, mock_coordinator: MagicMock
+    def test_setup_input_link_subscriptions_no_links(
+        self, mock_hass: SimpleNamespace, mock_config_entry: SimpleNamespace
     ) -> None:
         """Test setting up subscriptions with no input links."""
         input_links_opt = {}
@@ -339,43 +385,30 @@ class TestSetupInputLinkSubscriptions:
         input_names = {1: "Input 1", 2: "Input 2"}
         entities = []
 
-        # Ensure coordinator doesn't have the attribute initially
-        if hasattr(mock_coordinator, "_input_link_unsubs"):
-            delattr(mock_coordinator, "_input_link_unsubs")
-
         config = InputLinkConfig(
             input_links_opt=input_links_opt,
             active_inputs=active_inputs,
             input_names=input_names,
             entities=entities,
         )
-        _setup_input_link_subscriptions(mock_hass, mock_coordinator, config)
+        _setup_input_link_subscriptions(mock_hass, mock_config_entry, config)
 
-        # Should not create any subscriptions (early return before creating attribute)
-        # MagicMock will auto-create attributes, so we check it wasn't set to a list
-        if hasattr(mock_coordinator, "input_link_unsubs"):
-            # If it exists, it should be empty or not a list
-            unsubs = getattr(mock_coordinator, "input_link_unsubs", None)
-            # The function returns early, so this shouldn't be a list
-            assert not isinstance(unsubs, list) or len(unsubs) == 0
+        # Should not create any subscriptions
+        mock_config_entry.async_on_unload.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_setup_input_link_subscriptions_with_links(
-        self, mock_hass: MagicMock, mock_coordinator: MagicMock
+    def test_setup_input_link_subscriptions_with_links(
+        self, mock_hass: SimpleNamespace, mock_config_entry: SimpleNamespace
     ) -> None:
         """Test setting up subscriptions with input links."""
-        input_links_opt = {"1": "media_player.input1", "2": "media_player.input2"}
+        input_links_opt = {
+            "1": "media_player.input1",
+            "2": "media_player.input2",
+            "3": "media_player.input3",  # Inactive input, not tracked
+        }
         active_inputs = [1, 2]
         input_names = {1: "Input 1", 2: "Input 2"}
         entities = [MagicMock()]
 
-        # Set up mock to simulate a real coordinator with public API
-        # Since mock_coordinator is not a real TriadCoordinator, it will use
-        # the fallback path. Use a real list that we can check later - set it
-        # directly on the mock
-        unsubs_list: list[MagicMock] = []
-        mock_coordinator.input_link_unsubs = unsubs_list
-
         config = InputLinkConfig(
             input_links_opt=input_links_opt,
             active_inputs=active_inputs,
@@ -387,18 +420,19 @@ class TestSetupInputLinkSubscriptions:
         with patch(
             "custom_components.triad_ams.media_player.async_track_state_change_event",
             return_value=mock_unsub,
-        ):
-            _setup_input_link_subscriptions(mock_hass, mock_coordinator, config)
+        ) as mock_track:
+            _setup_input_link_subscriptions(mock_hass, mock_config_entry, config)
 
-            # Verify the unsubscribe function was registered
-            # The function should append to input_link_unsubs for mocks
-            # Check the actual list we set up
-            assert len(unsubs_list) == 1
-            assert unsubs_list[0] == mock_unsub
+            # A single subscription covers every linked entity
+            mock_track.assert_called_once_with(
+                mock_hass, ["media_player.input1", "media_player.input2"], ANY
+            )
 
-    @pytest.mark.asyncio
-    async def test_setup_input_link_subscriptions_updates_existing_names(
-        self, mock_hass: MagicMock, mock_coordinator: MagicMock
+            # The unsubscribe function runs when the entry unloads
+            mock_config_entry.async_on_unload.assert_called_once_with(mock_unsub)
+
+    def test_setup_input_link_subscriptions_updates_existing_names(
+        self, mock_hass: SimpleNamespace, mock_config_entry: SimpleNamespace
     ) -> None:
         """Test that setup updates names for entities that already exist."""
         input_links_opt = {"1": "media_player.input1"}
@@ -425,213 +459,168 @@ class TestSetupInputLinkSubscriptions:
                 entities=entities,
             )
             _setup_input_link_subscriptions(
-                mock_hass, mock_coordinator, config, state_getter=state_getter
+                mock_hass, mock_config_entry, config, state_getter=state_getter
             )
 
             # Should update the name
             assert input_names[1] == "Custom Name"
 
 
-class TestCleanupStaleEntities:
-    """Test _cleanup_stale_entities function."""
+def _registry_entity(unique_id: str, *, platform: str = "triad_ams") -> MagicMock:
+    """Create a registry entry for the test config entry."""
+    entity = MagicMock()
+    entity.platform = platform
+    entity.config_entry_id = "test_entry_123"
+    entity.unique_id = unique_id
+    entity.entity_id = f"media_player.{unique_id}"
+    return entity
+
+
+def _device(config_entries: set[str]) -> MagicMock:
+    """Create a device registry entry."""
+    device = MagicMock()
+    device.id = "device_123"
+    device.config_entries = config_entries
+    return device
+
+
+def _cleanup(
+    entry: SimpleNamespace,
+    output_numbers: frozenset[int],
+    entities: list[MagicMock],
+    devices: list[MagicMock],
+    device_entities: list[MagicMock],
+) -> SimpleNamespace:
+    """Run _cleanup_registries against fake registries and return the fakes."""
+    fakes = SimpleNamespace(
+        entity_registry=MagicMock(spec=er.EntityRegistry),
+        device_registry=MagicMock(spec=dr.DeviceRegistry),
+        entities_for_entry=MagicMock(return_value=entities),
+        entities_for_device=MagicMock(return_value=device_entities),
+        devices_for_entry=MagicMock(
+            side_effect=lambda _registry, entry_id: [
+                d for d in devices if entry_id in d.config_entries
+            ]
+        ),
+    )
+
+    # Fake the public registry lookup helpers rather than registry internals
+    with (
+        patch.object(er, "async_entries_for_config_entry", fakes.entities_for_entry),
+        patch.object(er, "async_entries_for_device", fakes.entities_for_device),
+        patch.object(dr, "async_entries_for_config_entry", fakes.devices_for_entry),
+    ):
+        _cleanup_registries(
+            SimpleNamespace(),
+            entry,
+            output_numbers,
+            entity_registry_getter=lambda _hass: fakes.entity_registry,
+            device_registry_getter=lambda _hass: fakes.device_registry,
+        )
+    return fakes
+
+
+class TestCleanupRegistries:
+    """Test _cleanup_registries function."""
 
-    def test_cleanup_stale_entities_removes_stale(
-        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    def test_cleanup_removes_stale_entities(
+        self, mock_config_entry: SimpleNamespace
     ) -> None:
         """Test removing stale entities."""
-        outputs = [
-            MagicMock(spec=TriadAmsOutput, number=1),
-            MagicMock(spec=TriadAmsOutput, number=2),
-        ]
-
-        mock_registry = MagicMock(spec=er.EntityRegistry)
-        mock_entity = MagicMock()
-        mock_entity.platform = "triad_ams"
-        mock_entity.config_entry_id = "test_entry_123"
-        mock_entity.unique_id = "test_entry_123_output_3"  # Stale
-        mock_entity.entity_id = "media_player.triad_ams_output_3"
-        mock_registry.entities = {"test_entry_123_output_3": mock_entity}
-        mock_registry.async_remove = MagicMock()
-
-        def get_registry(_hass: HomeAssistant) -> er.EntityRegistry:
-            return mock_registry
+        stale = _registry_entity("test_entry_123_output_3")
 
-        _cleanup_stale_entities(
-            mock_hass, mock_config_entry, outputs, entity_registry_getter=get_registry
-        )
+        fakes = _cleanup(mock_config_entry, frozenset({1, 2}), [stale], [], [])
 
-        mock_registry.async_remove.assert_called_once_with(
-            "media_player.triad_ams_output_3"
+        fakes.entities_for_entry.assert_called_once_with(
+            fakes.entity_registry, "test_entry_123"
         )
+        fakes.entity_registry.async_remove.assert_called_once_with(stale.entity_id)
 
-    def test_cleanup_stale_entities_keeps_active(
-        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    def test_cleanup_removes_every_stale_entity(
+        self, mock_config_entry: SimpleNamespace
     ) -> None:
-        """Test that active entities are not removed."""
-        outputs = [
-            MagicMock(spec=TriadAmsOutput, number=1),
-            MagicMock(spec=TriadAmsOutput, number=2),
+        """Test that all stale entities are removed in one pass."""
+        stale = [
+            _registry_entity("test_entry_123_output_3"),
+            _registry_entity("test_entry_123_output_4"),
         ]
+        active = _registry_entity("test_entry_123_output_1")
 
-        mock_registry = MagicMock(spec=er.EntityRegistry)
-        mock_entity = MagicMock()
-        mock_entity.platform = "triad_ams"
-        mock_entity.config_entry_id = "test_entry_123"
-        mock_entity.unique_id = "test_entry_123_output_1"  # Active
-        mock_entity.entity_id = "media_player.triad_ams_output_1"
-        mock_registry.entities = {"test_entry_123_output_1": mock_entity}
-        mock_registry.async_remove = MagicMock()
-
-        def get_registry(_hass: HomeAssistant) -> er.EntityRegistry:
-            return mock_registry
+        fakes = _cleanup(mock_config_entry, frozenset({1}), [active, *stale], [], [])
 
-        _cleanup_stale_entities(
-            mock_hass, mock_config_entry, outputs, entity_registry_getter=get_registry
+        assert fakes.entity_registry.async_remove.call_count == len(stale)
+        fakes.entity_registry.async_remove.assert_has_calls(
+            [call(ent.entity_id) for ent in stale]
         )
 
-        mock_registry.async_remove.assert_not_called()
-
-    def test_cleanup_stale_entities_different_platform(
-        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    @pytest.mark.parametrize(
+        "entity",
+        [
+            _registry_entity("test_entry_123_output_1"),
+            _registry_entity("test_entry_123_output_3", platform="other_platform"),
+        ],
+        ids=["active_output", "other_platform"],
+    )
+    def test_cleanup_keeps_entities(
+        self, mock_config_entry: SimpleNamespace, entity: MagicMock
     ) -> None:
-        """Test that entities from other platforms are not removed."""
-        outputs = [MagicMock(spec=TriadAmsOutput, number=1)]
+        """Test that active and foreign-platform entities are not removed."""
+        fakes = _cleanup(mock_config_entry, frozenset({1}), [entity], [], [])
 
-        mock_registry = MagicMock(spec=er.EntityRegistry)
-        mock_entity = MagicMock()
-        mock_entity.platform = "other_platform"
-        mock_entity.config_entry_id = "test_entry_123"
-        mock_entity.unique_id = "test_entry_123_output_1"
-        mock_registry.entities = {"test_entry_123_output_1": mock_entity}
-        mock_registry.async_remove = MagicMock()
-
-        def get_registry(_hass: HomeAssistant) -> er.EntityRegistry:
-            return mock_registry
-
-        _cleanup_stale_entities(
-            mock_hass, mock_config_entry, outputs, entity_registry_getter=get_registry
-        )
+        fakes.entity_registry.async_remove.assert_not_called()
 
-        mock_registry.async_remove.assert_not_called()
-
-
-class TestRemoveOrphanedDevices:
-    """Test _remove_orphaned_devices function."""
-
-    def test_remove_orphaned_devices_removes_orphan(
-        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    def test_cleanup_removes_orphaned_device(
+        self, mock_config_entry: SimpleNamespace
     ) -> None:
-        """Test removing orphaned devices."""
-        mock_entity_registry = MagicMock(spec=er.EntityRegistry)
-        mock_device_registry = MagicMock(spec=dr.DeviceRegistry)
-
-        mock_device = MagicMock()
-        mock_device.id = "device_123"
-        mock_device.config_entries = {"test_entry_123"}
-        mock_device_registry.devices = {"device_123": mock_device}
-        mock_device_registry.async_remove_device = MagicMock()
-
-        # No entities for this device
-        mock_entity_registry.async_entries_for_device = MagicMock(return_value=[])
-
-        def get_entity_registry(_hass: HomeAssistant) -> er.EntityRegistry:
-            return mock_entity_registry
-
-        def get_device_registry(_hass: HomeAssistant) -> dr.DeviceRegistry:
-            return mock_device_registry
-
-        def get_entries_for_device(
-            _registry: er.EntityRegistry,
-            device_id: str,
-            *,
-            include_disabled_entities: bool,
-        ) -> list:
-            return mock_entity_registry.async_entries_for_device(
-                device_id, include_disabled_entities
-            )
-
-        _remove_orphaned_devices(
-            mock_hass,
+        """Test removing devices without any entities."""
+        fakes = _cleanup(
             mock_config_entry,
-            entity_registry_getter=get_entity_registry,
-            device_registry_getter=get_device_registry,
-            entries_for_device_getter=get_entries_for_device,
+            frozenset({1}),
+            [_registry_entity("test_entry_123_output_1")],
+            [_device({"test_entry_123"})],
+            [],
         )
 
-        mock_device_registry.async_remove_device.assert_called_once_with("device_123")
-
-    def test_remove_orphaned_devices_keeps_device_with_entities(
-        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+        fakes.devices_for_entry.assert_called_once_with(
+            fakes.device_registry, "test_entry_123"
+        )
+        fakes.entities_for_device.assert_called_once_with(
+            fakes.entity_registry, "device_123", include_disabled_entities=True
+        )
+        fakes.device_registry.async_remove_device.assert_called_once_with("device_123")
+
+    @pytest.mark.parametrize(
+        ("config_entries", "device_entities"),
+        [({"test_entry_123"}, [MagicMock()]), ({"other_entry"}, [])],
+        ids=["has_entities", "other_entry"],
+    )
+    def test_cleanup_keeps_device(
+        self,
+        mock_config_entry: SimpleNamespace,
+        config_entries: set[str],
+        device_entities: list[MagicMock],
     ) -> None:
-        """Test that devices with entities are not removed."""
-        mock_entity_registry = MagicMock(spec=er.EntityRegistry)
-        mock_device_registry = MagicMock(spec=dr.DeviceRegistry)
-
-        mock_device = MagicMock()
-        mock_device.id = "device_123"
-        mock_device.config_entries = {"test_entry_123"}
-        mock_device_registry.devices = {"device_123": mock_device}
-        mock_device_registry.async_remove_device = MagicMock()
-
-        # Has entities
-        mock_entity = MagicMock()
-        mock_entity_registry.async_entries_for_device = MagicMock(
-            return_value=[mock_entity]
-        )
-
-        def get_entity_registry(_hass: HomeAssistant) -> er.EntityRegistry:
-            return mock_entity_registry
-
-        def get_device_registry(_hass: HomeAssistant) -> dr.DeviceRegistry:
-            return mock_device_registry
-
-        def get_entries_for_device(
-            _registry: er.EntityRegistry,
-            device_id: str,
-            *,
-            include_disabled_entities: bool,
-        ) -> list:
-            return mock_entity_registry.async_entries_for_device(
-                device_id, include_disabled_entities
-            )
-
-        _remove_orphaned_devices(
-            mock_hass,
+        """Test that devices with entities or of other entries are kept."""
+        fakes = _cleanup(
             mock_config_entry,
-            entity_registry_getter=get_entity_registry,
-            device_registry_getter=get_device_registry,
-            entries_for_device_getter=get_entries_for_device,
+            frozenset({1}),
+            [_registry_entity("test_entry_123_output_1")],
+            [_device(config_entries)],
+            device_entities,
         )
 
-        mock_device_registry.async_remove_device.assert_not_called()
+        fakes.device_registry.async_remove_device.assert_not_called()
 
-    def test_remove_orphaned_devices_different_entry(
-        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    def test_cleanup_removes_orphaned_device_without_entities(
+        self, mock_config_entry: SimpleNamespace
     ) -> None:
-        """Test that devices from other entries are not removed."""
-        mock_entity_registry = MagicMock(spec=er.EntityRegistry)
-        mock_device_registry = MagicMock(spec=dr.DeviceRegistry)
-
-        mock_device = MagicMock()
-        mock_device.id = "device_123"
-        mock_device.config_entries = {"other_entry"}  # Different entry
-        mock_device_registry.devices = {"device_123": mock_device}
-        mock_device_registry.async_remove_device = MagicMock()
-
-        def get_entity_registry(_hass: HomeAssistant) -> er.EntityRegistry:
-            return mock_entity_registry
-
-        def get_device_registry(_hass: HomeAssistant) -> dr.DeviceRegistry:
-            return mock_device_registry
-
-        _remove_orphaned_devices(
-            mock_hass,
-            mock_config_entry,
-            entity_registry_getter=get_entity_registry,
-            device_registry_getter=get_device_registry,
+        """Test devices are reaped even when the entry has no entities left."""
+        fakes = _cleanup(
+            mock_config_entry, frozenset(), [], [_device({"test_entry_123"})], []
         )
 
-        mock_device_registry.async_remove_device.assert_not_called()
+        fakes.entity_registry.async_remove.assert_not_called()
+        fakes.device_registry.async_remove_device.assert_called_once_with("device_123")
 
 
 class TestAsyncSetupEntry:
@@ -640,8 +629,9 @@ class TestAsyncSetupEntry:
     @pytest.mark.asyncio
     async def test_async_setup_entry_creates_entities(
         self,
-        mock_hass: MagicMock,
-        mock_config_entry: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_hass: SimpleNamespace,
+        mock_config_entry: SimpleNamespace,
         mock_coordinator: MagicMock,
         mock_async_add_entities: MagicMock,
     ) -> None:
@@ -653,66 +643,35 @@ class TestAsyncSetupEntry:
             "input_links": {},
         }
 
-        mock_registry = MagicMock(spec=er.EntityRegistry)
-        mock_registry.entities = {}
-        mock_registry.async_remove = MagicMock()
-
-        mock_device_registry = MagicMock(spec=dr.DeviceRegistry)
-        mock_device_registry.devices = {}
-
-        def get_entity_registry(_hass: HomeAssistant) -> er.EntityRegistry:
-            return mock_registry
-
-        def get_device_registry(_hass: HomeAssistant) -> dr.DeviceRegistry:
-            return mock_device_registry
-
-        def get_entries_for_device(
-            _registry: er.EntityRegistry,
-            _device_id: str,
-            *,
-            _include_disabled_entities: bool,
-        ) -> list:
-            return []
-
-        with patch(
-            "custom_components.triad_ams.media_player.TriadAmsOutput"
-        ) as mock_output_class:
-            mock_output1 = MagicMock(spec=TriadAmsOutput)
-            mock_output1.number = 1
-            mock_output2 = MagicMock(spec=TriadAmsOutput)
-            mock_output2.number = 2
-            mock_output_class.side_effect = [mock_output1, mock_output2]
-
-            with (
-                patch(
-                    "custom_components.triad_ams.media_player._cleanup_stale_entities"
-                ) as mock_cleanup,
-                patch(
-                    "custom_components.triad_ams.media_player._remove_orphaned_devices"
-                ) as mock_remove,
-            ):
-                await async_setup_entry(
-                    mock_hass, mock_config_entry, mock_async_add_entities
-                )
-
-                # Should create 2 outputs
-                assert mock_output_class.call_count == 2
-                # Should register outputs
-                assert mock_coordinator.register_output.call_count == 2
-                # Should add entities
-                mock_async_add_entities.assert_called_once()
-                call_args = mock_async_add_entities.call_args[0][0]
-                assert len(call_args) == 2
-                assert all(isinstance(e, TriadAmsMediaPlayer) for e in call_args)
-                # Should call cleanup
-                mock_cleanup.assert_called_once()
-                mock_remove.assert_called_once()
+        mock_output1 = MagicMock(spec=TriadAmsOutput)
+        mock_output1.number = 1
+        mock_output2 = MagicMock(spec=TriadAmsOutput)
+        mock_output2.number = 2
+        mock_output_class = MagicMock(side_effect=[mock_output1, mock_output2])
+        mock_cleanup = MagicMock()
+        monkeypatch.setattr(f"{_MEDIA_PLAYER}.TriadAmsOutput", mock_output_class)
+        monkeypatch.setattr(f"{_MEDIA_PLAYER}._cleanup_registries", mock_cleanup)
+
+        await async_setup_entry(mock_hass, mock_config_entry, mock_async_add_entities)
+
+        # Should create 2 outputs
+        assert mock_output_class.call_count == 2
+        # Should register outputs
+        assert mock_coordinator.register_output.call_count == 2
+        # Should add entities
+        mock_async_add_entities.assert_called_once()
+        call_args = mock_async_add_entities.call_args[0][0]
+        assert len(call_args) == 2
+        assert all(isinstance(e, TriadAmsMediaPlayer) for e in call_args)
+        # Should call cleanup
+        mock_cleanup.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_async_setup_entry_with_input_links(
         self,
-        mock_hass: MagicMock,
-        mock_config_entry: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_hass: SimpleNamespace,
+        mock_config_entry: SimpleNamespace,
         mock_coordinator: MagicMock,
         mock_async_add_entities: MagicMock,
     ) -> None:
@@ -724,42 +683,28 @@ class TestAsyncSetupEntry:
             "input_links": {"1": "media_player.input1"},
         }
 
-        mock_registry = MagicMock(spec=er.EntityRegistry)
-        mock_registry.entities = {}
+        mock_output = MagicMock(spec=TriadAmsOutput)
+        mock_output.number = 1
+        mock_setup_links = MagicMock()
+        monkeypatch.setattr(
+            f"{_MEDIA_PLAYER}.TriadAmsOutput", MagicMock(return_value=mock_output)
+        )
+        monkeypatch.setattr(
+            f"{_MEDIA_PLAYER}._setup_input_link_subscriptions", mock_setup_links
+        )
+        monkeypatch.setattr(f"{_MEDIA_PLAYER}._cleanup_registries", MagicMock())
 
-        mock_device_registry = MagicMock(spec=dr.DeviceRegistry)
-        mock_device_registry.devices = {}
+        await async_setup_entry(mock_hass, mock_config_entry, mock_async_add_entities)
 
-        with patch(
-            "custom_components.triad_ams.media_player.TriadAmsOutput"
-        ) as mock_output_class:
-            mock_output = MagicMock(spec=TriadAmsOutput)
-            mock_output.number = 1
-            mock_output_class.return_value = mock_output
-
-            with (
-                patch(
-                    "custom_components.triad_ams.media_player._setup_input_link_subscriptions"
-                ) as mock_setup_links,
-                patch(
-                    "custom_components.triad_ams.media_player._cleanup_stale_entities"
-                ),
-                patch(
-                    "custom_components.triad_ams.media_player._remove_orphaned_devices"
-                ),
-            ):
-                await async_setup_entry(
-                    mock_hass, mock_config_entry, mock_async_add_entities
-                )
-
-                # Should set up input link subscriptions
-                mock_setup_links.assert_called_once()
+        # Should set up input link subscriptions
+        mock_setup_links.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_async_setup_entry_handles_coordinator_start_error(
         self,
-        mock_hass: MagicMock,
-        mock_config_entry: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_hass: SimpleNamespace,
+        mock_config_entry: SimpleNamespace,
         mock_coordinator: MagicMock,
         mock_async_add_entities: MagicMock,
     ) -> None:
@@ -772,34 +717,25 @@ class TestAsyncSetupEntry:
         }
         mock_coordinator.start.side_effect = Exception("Start failed")
 
-        with patch(
-            "custom_components.triad_ams.media_player.TriadAmsOutput"
-        ) as mock_output_class:
-            mock_output = MagicMock(spec=TriadAmsOutput)
-            mock_output.number = 1
-            mock_output_class.return_value = mock_output
-
-            with (
-                patch(
-                    "custom_components.triad_ams.media_player._cleanup_stale_entities"
-                ),
-                patch(
-                    "custom_components.triad_ams.media_player._remove_orphaned_devices"
-                ),
-            ):
-                # Should not raise
-                await async_setup_entry(
-                    mock_hass, mock_config_entry, mock_async_add_entities
-                )
-
-                # Should still create entities
-                mock_async_add_entities.assert_called_once()
+        mock_output = MagicMock(spec=TriadAmsOutput)
+        mock_output.number = 1
+        monkeypatch.setattr(
+            f"{_MEDIA_PLAYER}.TriadAmsOutput", MagicMock(return_value=mock_output)
+        )
+        monkeypatch.setattr(f"{_MEDIA_PLAYER}._cleanup_registries", MagicMock())
+
+        # Should not raise
+        await async_setup_entry(mock_hass, mock_config_entry, mock_async_add_entities)
+
+        # Should still create entities
+        mock_async_add_entities.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_async_setup_entry_calls_cleanup(
         self,
-        mock_hass: MagicMock,
-        mock_config_entry: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_hass: SimpleNamespace,
+        mock_config_entry: SimpleNamespace,
         mock_coordinator: MagicMock,
         mock_async_add_entities: MagicMock,
     ) -> None:
@@ -811,25 +747,17 @@ class TestAsyncSetupEntry:
             "input_links": {},
         }
 
-        with patch(
-            "custom_components.triad_ams.media_player.TriadAmsOutput"
-        ) as mock_output_class:
-            mock_output = MagicMock(spec=TriadAmsOutput)
-            mock_output.number = 1
-            mock_output_class.return_value = mock_output
-
-            with (
-                patch(
-                    "custom_components.triad_ams.media_player._cleanup_stale_entities"
-                ) as mock_cleanup,
-                patch(
-                    "custom_components.triad_ams.media_player._remove_orphaned_devices"
-                ) as mock_remove_devices,
-            ):
-                await async_setup_entry(
-                    mock_hass, mock_config_entry, mock_async_add_entities
-                )
-
-                # Should call cleanup functions
-                mock_cleanup.assert_called_once()
-                mock_remove_devices.assert_called_once()
+        mock_output = MagicMock(spec=TriadAmsOutput)
+        mock_output.number = 1
+        mock_cleanup = MagicMock()
+        monkeypatch.setattr(
+            f"{_MEDIA_PLAYER}.TriadAmsOutput", MagicMock(return_value=mock_output)
+        )
+        monkeypatch.setattr(f"{_MEDIA_PLAYER}._cleanup_registries", mock_cleanup)
+
+        await async_setup_entry(mock_hass, mock_config_entry, mock_async_add_entities)
+
+        # Should call cleanup with the active output numbers
+        mock_cleanup.assert_called_once_with(
+            mock_hass, mock_config_entry, frozenset({1})
+        )
@@ -1,5 +1,7 @@
 """Unit tests for TriadAmsOutput model."""
 
+from collections.abc import Awaitable, Callable, Mapping
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import pytest
@@ -7,6 +9,18 @@ import pytest
 from custom_components.triad_ams.models import TriadAmsOutput
 from tests.conftest import create_async_mock_method
 
+# Run every async test in this module on one shared event loop; the mark
+# also lands on sync tests, where pytest-asyncio only warns that it is unused
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.filterwarnings(
+        "ignore:The test <Function .*> is marked with '@pytest.mark.asyncio'"
+        ":pytest.PytestWarning"
+    ),
+]
+
+_INPUT_NAMES = MappingProxyType({i: f"Input {i}" for i in range(1, 9)})
+
 
 @pytest.fixture
 def mock_coordinator() -> MagicMock:
@@ -25,14 +39,16 @@ def mock_coordinator() -> MagicMock:
     return coordinator
 
 
-@pytest.fixture
-def input_names() -> dict[int, str]:
-    """Return default input names."""
-    return {i: f"Input {i}" for i in range(1, 9)}
+@pytest.fixture(scope="session")
+def input_names() -> Mapping[int, str]:
+    """Return default input names (read-only, so safe to share)."""
+    return _INPUT_NAMES
 
 
 @pytest.fixture
-def output(mock_coordinator: MagicMock, input_names: dict[int, str]) -> TriadAmsOutput:
+def output(
+    mock_coordinator: MagicMock, input_names: Mapping[int, str]
+) -> TriadAmsOutput:
     """Create a TriadAmsOutput instance."""
     return TriadAmsOutput(1, "Output 1", mock_coordinator, None, input_names)
 
@@ -41,7 +57,7 @@ class TestTriadAmsOutputInitialization:
     """Test TriadAmsOutput initialization."""
 
     def test_initialization(
-        self, mock_coordinator: MagicMock, input_names: dict[int, str]
+        self, mock_coordinator: MagicMock, input_names: Mapping[int, str]
     ) -> None:
         """Test basic initialization."""
         output = TriadAmsOutput(1, "Test Output", mock_coordinator, None, input_names)
@@ -70,7 +86,6 @@ class TestTriadAmsOutputInitialization:
 class TestTriadAmsOutputSource:
     """Test source management."""
 
-    @pytest.mark.asyncio
     async def test_set_source(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -80,16 +95,6 @@ class TestTriadAmsOutputSource:
         assert output.source == 2
         assert output.is_on is True
 
-    @pytest.mark.asyncio
-    async def test_set_source_handles_error(
-        self, output: TriadAmsOutput, mock_coordinator: MagicMock
-    ) -> None:
-        """Test that set_source handles OSError."""
-        mock_coordinator.set_output_to_input.side_effect = OSError("Connection failed")
-        await output.set_source(2)
-        # Source should not be set on error
-        assert output.source is None
-
     def test_source_name(self, output: TriadAmsOutput) -> None:
         """Test source_name property."""
         assert output.source_name is None
@@ -120,7 +125,6 @@ class TestTriadAmsOutputSource:
 class TestTriadAmsOutputVolume:
     """Test volume operations."""
 
-    @pytest.mark.asyncio
     async def test_set_volume(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -131,7 +135,6 @@ class TestTriadAmsOutputVolume:
         assert output.volume is not None
         assert 0.0 <= output.volume <= 1.0
 
-    @pytest.mark.asyncio
     async def test_set_volume_zero_becomes_minimum(
         self,
         output: TriadAmsOutput,
@@ -143,16 +146,6 @@ class TestTriadAmsOutputVolume:
         assert output.volume is not None
         assert output.volume > 0.0
 
-    @pytest.mark.asyncio
-    async def test_set_volume_handles_error(
-        self, output: TriadAmsOutput, mock_coordinator: MagicMock
-    ) -> None:
-        """Test that set_volume handles OSError."""
-        mock_coordinator.set_output_volume.side_effect = OSError("Connection failed")
-        await output.set_volume(0.5)
-        # Volume should remain unchanged on error
-
-    @pytest.mark.asyncio
     async def test_volume_up_step(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -160,7 +153,6 @@ class TestTriadAmsOutputVolume:
         await output.volume_up_step(large=False)
         mock_coordinator.volume_step_up.assert_called_once_with(1, large=False)
 
-    @pytest.mark.asyncio
     async def test_volume_up_step_large(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -168,7 +160,6 @@ class TestTriadAmsOutputVolume:
         await output.volume_up_step(large=True)
         mock_coordinator.volume_step_up.assert_called_once_with(1, large=True)
 
-    @pytest.mark.asyncio
     async def test_volume_down_step(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -176,20 +167,10 @@ class TestTriadAmsOutputVolume:
         await output.volume_down_step(large=False)
         mock_coordinator.volume_step_down.assert_called_once_with(1, large=False)
 
-    @pytest.mark.asyncio
-    async def test_volume_step_handles_error(
-        self, output: TriadAmsOutput, mock_coordinator: MagicMock
-    ) -> None:
-        """Test that volume steps handle OSError."""
-        mock_coordinator.volume_step_up.side_effect = OSError("Connection failed")
-        await output.volume_up_step()
-        # Should not raise
-
 
 class TestTriadAmsOutputMute:
     """Test mute operations."""
 
-    @pytest.mark.asyncio
     async def test_set_muted_true(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -198,7 +179,6 @@ class TestTriadAmsOutputMute:
         mock_coordinator.set_output_mute.assert_called_once_with(1, mute=True)
         assert output.muted is True
 
-    @pytest.mark.asyncio
     async def test_set_muted_false(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -208,20 +188,10 @@ class TestTriadAmsOutputMute:
         mock_coordinator.set_output_mute.assert_called_once_with(1, mute=False)
         assert output.muted is False
 
-    @pytest.mark.asyncio
-    async def test_set_muted_handles_error(
-        self, output: TriadAmsOutput, mock_coordinator: MagicMock
-    ) -> None:
-        """Test that set_muted handles OSError."""
-        mock_coordinator.set_output_mute.side_effect = OSError("Connection failed")
-        await output.set_muted(muted=True)
-        # Should not raise
-
 
 class TestTriadAmsOutputPower:
     """Test power operations."""
 
-    @pytest.mark.asyncio
     async def test_turn_off(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -234,16 +204,6 @@ class TestTriadAmsOutputPower:
         assert output.is_on is False
         assert output._last_assigned_input == 2  # Should remember last source
 
-    @pytest.mark.asyncio
-    async def test_turn_off_handles_error(
-        self, output: TriadAmsOutput, mock_coordinator: MagicMock
-    ) -> None:
-        """Test that turn_off handles OSError."""
-        mock_coordinator.disconnect_output.side_effect = OSError("Connection failed")
-        await output.turn_off()
-        # Should not raise
-
-    @pytest.mark.asyncio
     async def test_turn_on_with_remembered_source(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -254,7 +214,6 @@ class TestTriadAmsOutputPower:
         mock_coordinator.set_output_to_input.assert_called_once_with(1, 3)
         assert output.is_on is True
 
-    @pytest.mark.asyncio
     async def test_turn_on_without_remembered_source(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -266,49 +225,72 @@ class TestTriadAmsOutputPower:
         mock_coordinator.set_output_to_input.assert_not_called()
 
 
+class TestTriadAmsOutputErrorHandling:
+    """Test that device errors leave cached state untouched."""
+
+    @pytest.mark.parametrize(
+        ("coordinator_method", "call"),
+        [
+            ("set_output_to_input", lambda o: o.set_source(2)),
+            ("set_output_volume", lambda o: o.set_volume(0.5)),
+            ("volume_step_up", lambda o: o.volume_up_step()),
+            ("set_output_mute", lambda o: o.set_muted(muted=True)),
+            ("disconnect_output", lambda o: o.turn_off()),
+        ],
+        ids=["set_source", "set_volume", "volume_step", "set_muted", "turn_off"],
+    )
+    async def test_command_handles_error(
+        self,
+        output: TriadAmsOutput,
+        mock_coordinator: MagicMock,
+        coordinator_method: str,
+        call: Callable[[TriadAmsOutput], Awaitable[None]],
+    ) -> None:
+        """Test that a command swallows OSError without updating state."""
+        # Seed state that every successful command would change
+        output._assigned_input = 3
+        output._last_assigned_input = 3
+        output._ui_on = True
+        output._volume = 0.3
+        output._muted = False
+        getattr(mock_coordinator, coordinator_method).side_effect = OSError(
+            "Connection failed"
+        )
+        await call(output)
+        assert output.source == 3
+        assert output._last_assigned_input == 3
+        assert output.volume == 0.3
+        assert output.muted is False
+        assert output.is_on is True
+
+
 class TestTriadAmsOutputRefresh:
     """Test refresh operations."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("device_source", "expected_source", "expected_on"),
+        [(2, 2, True), (None, None, False), (99, None, False)],
+        ids=["routed", "audio_off", "invalid_source"],
+    )
     async def test_refresh(
-        self, output: TriadAmsOutput, mock_coordinator: MagicMock
+        self,
+        output: TriadAmsOutput,
+        mock_coordinator: MagicMock,
+        device_source: int | None,
+        expected_source: int | None,
+        expected_on: bool,  # noqa: FBT001
     ) -> None:
         """Test refreshing state updates volume, mute, and source."""
         mock_coordinator.get_output_volume.return_value = 0.6
-        mock_coordinator.get_output_source.return_value = 2
+        mock_coordinator.get_output_source.return_value = device_source
 
         await output.refresh()
 
         assert output.volume == 0.6
-        assert output.source == 2
-        assert output.is_on is True
+        assert output.source == expected_source
+        assert output.is_on is expected_on
         mock_coordinator.get_output_mute.assert_called_once_with(1)
 
-    @pytest.mark.asyncio
-    async def test_refresh_with_audio_off(
-        self, output: TriadAmsOutput, mock_coordinator: MagicMock
-    ) -> None:
-        """Test refresh when output is off."""
-        mock_coordinator.get_output_source.return_value = None
-
-        await output.refresh()
-
-        assert output.source is None
-        assert output.is_on is False
-
-    @pytest.mark.asyncio
-    async def test_refresh_with_invalid_source(
-        self, output: TriadAmsOutput, mock_coordinator: MagicMock
-    ) -> None:
-        """Test refresh with invalid source number."""
-        mock_coordinator.get_output_source.return_value = 99  # Out of range
-
-        await output.refresh()
-
-        assert output.source is None
-        assert output.is_on is False
-
-    @pytest.mark.asyncio
     async def test_refresh_handles_error(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -318,7 +300,6 @@ class TestTriadAmsOutputRefresh:
         # Should not raise
         mock_coordinator.get_output_source.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_refresh_mute_error_is_suppressed(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -333,7 +314,6 @@ class TestTriadAmsOutputRefresh:
         assert output.source == 2
         assert output.is_on is True
 
-    @pytest.mark.asyncio
     async def test_refresh_source_error_aborts(
         self, output: TriadAmsOutput, mock_coordinator: MagicMock
     ) -> None:
@@ -350,7 +330,6 @@ class TestTriadAmsOutputRefresh:
         assert output.source is None
         assert output.is_on is False
 
-    @pytest.mark.asyncio
     async def test_refresh_and_notify(
         self,
         output: TriadAmsOutput,
@@ -13,106 +13,115 @@ from custom_components.triad_ams.volume_lut import (
 class TestDbForStep:
     """Test db_for_step function."""
 
-    def test_valid_steps(self) -> None:
+    @pytest.mark.parametrize(
+        ("step", "expected"),
+        [(1, -100.3), (50, -21.2), (100, 0.0)],
+        ids=["min", "mid", "max"],
+    )
+    def test_valid_steps(self, step: int, expected: float) -> None:
         """Test valid step values."""
-        assert db_for_step(1) == -100.3
-        assert db_for_step(50) == -21.2
-        assert db_for_step(100) == 0.0
+        assert db_for_step(step) == expected
 
-    def test_boundary_values(self) -> None:
-        """Test boundary step values."""
-        assert db_for_step(1) == -100.3
-        assert db_for_step(100) == 0.0
-
-    def test_invalid_low_step(self) -> None:
-        """Test invalid low step value."""
-        with pytest.raises(ValueError, match=r"step must be in 1\.\.100"):
-            db_for_step(0)
-
-    def test_invalid_high_step(self) -> None:
-        """Test invalid high step value."""
+    @pytest.mark.parametrize("step", [0, 101, -1], ids=["low", "high", "negative"])
+    def test_invalid_step(self, step: int) -> None:
+        """Test out-of-range step values are rejected."""
         with pytest.raises(ValueError, match=r"step must be in 1\.\.100"):
-            db_for_step(101)
-
-    def test_negative_step(self) -> None:
-        """Test negative step value."""
-        with pytest.raises(ValueError, match=r"step must be in 1\.\.100"):
-            db_for_step(-1)
+            db_for_step(step)
 
 
 class TestStepForDb:
     """Test step_for_db function."""
 
-    def test_exact_matches(self) -> None:
-        """Test exact dB matches."""
-        assert step_for_db(-100.3) == 1
-        assert step_for_db(0.0) == 99  # 0.0 dB maps to step 99, not 100
-
-    def test_near_matches(self) -> None:
-        """Test near dB matches."""
-        # Should round to nearest step
-        assert step_for_db(-21.0) in [49, 50, 51]  # Around step 50
-        assert step_for_db(-50.0) in [13, 14, 15]  # Around step 14
-
-    def test_boundary_values(self) -> None:
-        """Test boundary dB values."""
-        # Very low dB should map to step 1
-        assert step_for_db(-200.0) == 1
-        # Very high dB should map to step 100
-        assert step_for_db(10.0) == 100
-
-    def test_mid_range_values(self) -> None:
-        """Test mid-range dB values."""
-        step = step_for_db(-30.0)
-        assert 1 <= step <= 100
-        assert isinstance(step, int)
+    @pytest.mark.parametrize(
+        ("db", "expected"),
+        [
+            (-100.3, 1),
+            (-99.0, 1),
+            (0.0, 100),
+            (-200.0, 1),
+            (10.0, 100),
+        ],
+        ids=["exact_min", "near_min", "exact_zero", "below_range", "above_range"],
+    )
+    def test_exact_and_boundary_values(self, db: float, expected: int) -> None:
+        """Test exact dB matches and clamping of out-of-range dB values."""
+        assert step_for_db(db) == expected
+
+    @pytest.mark.parametrize(
+        ("db", "expected"),
+        [(-21.0, {49, 50, 51}), (-50.0, {13, 14, 15})],
+        ids=["around_step_50", "around_step_14"],
+    )
+    def test_near_matches(self, db: float, expected: set[int]) -> None:
+        """Test near dB matches round to a neighbouring step."""
+        assert step_for_db(db) in expected
+
+    @pytest.mark.parametrize("step", range(1, 101))
+    def test_round_trip(self, step: int) -> None:
+        """Test every measured dB maps back to its own step."""
+        assert step_for_db(db_for_step(step)) == step
 
 
 class TestPercentageForStep:
     """Test percentage_for_step function."""
 
-    def test_valid_steps(self) -> None:
-        """Test valid step values."""
-        assert percentage_for_step(1) == 0.01
-        assert percentage_for_step(50) == 0.5
-        assert percentage_for_step(100) == 1.0
-
-    def test_boundary_clamping(self) -> None:
-        """Test that out-of-range steps are clamped."""
-        assert percentage_for_step(0) == 0.01  # Clamped to 1
-        assert percentage_for_step(101) == 1.0  # Clamped to 100
-        assert percentage_for_step(-1) == 0.01  # Clamped to 1
-
-    def test_precision(self) -> None:
-        """Test precision of percentage calculation."""
-        assert percentage_for_step(25) == 0.25
-        assert percentage_for_step(33) == 0.33
-        assert percentage_for_step(75) == 0.75
+    @pytest.mark.parametrize(
+        ("step", "expected"),
+        [
+            (1, 0.01),
+            (25, 0.25),
+            (33, 0.33),
+            (50, 0.5),
+            (75, 0.75),
+            (100, 1.0),
+            (0, 0.01),  # Clamped to 1
+            (101, 1.0),  # Clamped to 100
+            (-1, 0.01),  # Clamped to 1
+        ],
+        ids=["1", "25", "33", "50", "75", "100", "zero", "above_max", "negative"],
+    )
+    def test_percentage(self, step: int, expected: float) -> None:
+        """Test percentages for valid and clamped step values."""
+        assert percentage_for_step(step) == expected
 
 
 class TestStepForPercentage:
     """Test step_for_percentage function."""
 
-    def test_valid_percentages(self) -> None:
-        """Test valid percentage values."""
-        assert step_for_percentage(0.0) == 1  # Minimum step
-        assert step_for_percentage(0.5) == 50
-        assert step_for_percentage(1.0) == 100
-
-    def test_boundary_clamping(self) -> None:
-        """Test that out-of-range percentages are clamped."""
-        assert step_for_percentage(-0.1) == 1  # Clamped to 0.0 -> step 1
-        assert step_for_percentage(1.5) == 100  # Clamped to 1.0 -> step 100
-
-    def test_rounding(self) -> None:
-        """Test rounding behavior."""
-        assert step_for_percentage(0.25) == 25
-        assert step_for_percentage(0.33) == 33
-        assert step_for_percentage(0.75) == 75
-        assert step_for_percentage(0.123) == 12  # Rounded
-        assert step_for_percentage(0.999) == 100  # Rounded to max
-
-    def test_minimum_step(self) -> None:
-        """Test that zero percentage maps to minimum step."""
-        assert step_for_percentage(0.0) == 1
-        assert step_for_percentage(0.001) == 1  # Very small -> step 1
+    @pytest.mark.parametrize(
+        ("percentage", "expected"),
+        [
+            (0.0, 1),  # Minimum step
+            (0.001, 1),  # Very small -> step 1
+            (0.123, 12),  # Rounded
+            (0.25, 25),
+            (0.33, 33),
+            (0.5, 50),
+            (0.75, 75),
+            (0.999, 100),  # Rounded to max
+            (1.0, 100),
+            (-0.1, 1),  # Clamped to 0.0 -> step 1
+            (1.5, 100),  # Clamped to 1.0 -> step 100
+        ],
+        ids=[
+            "0",
+            "0.001",
+            "0.123",
+            "0.25",
+            "0.33",
+            "0.5",
+            "0.75",
+            "0.999",
+            "1",
+            "negative",
+            "above_max",
+        ],
+    )
+    def test_step(self, percentage: float, expected: int) -> None:
+        """Test steps for valid, rounded and clamped percentages."""
+        assert step_for_percentage(percentage) == expected
+
+    @pytest.mark.parametrize("step", range(1, 101))
+    def test_round_trip(self, step: int) -> None:
+        """Test every step survives a percentage round trip."""
+        assert step_for_percentage(percentage_for_step(step)) == step